@@ -5,6 +5,7 @@ Creates and restores checkpoints for rollback capability.
 
 import hashlib
 import json
+import os
 import shutil
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
@@ -41,6 +42,31 @@ class RollbackResult:
     files_restored: list[str]
     errors: list[str] = field(default_factory=list)
     message: str = ""
+    git_ref_after: Optional[str] = None
+
+
+# Parsed checkpoint.json contents keyed by path. Entries are validated
+# against the file's (inode, mtime, size) so rewrites are always picked up.
+_metadata_cache: dict[str, tuple[tuple[int, int, int], dict]] = {}
+
+
+def _load_checkpoint_metadata(metadata_path: str) -> Optional[dict]:
+    """Load checkpoint metadata, reusing the cached parse if the file is unchanged."""
+    try:
+        st = os.stat(metadata_path)
+    except FileNotFoundError:
+        _metadata_cache.pop(metadata_path, None)
+        return None
+
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _metadata_cache.get(metadata_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(metadata_path) as f:
+        data = json.load(f)
+    _metadata_cache[metadata_path] = (stamp, data)
+    return data
 
 
 def _compute_file_hash(path: Path) -> str:
@@ -55,6 +81,19 @@ def _compute_file_hash(path: Path) -> str:
     return hasher.hexdigest()
 
 
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with a Z suffix."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _atomic_write_json(path: Path, data: dict) -> None:
+    """Write JSON to a sibling temp file and atomically move it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
 def _checkpoint_to_dict(checkpoint: Checkpoint) -> dict:
     """Convert Checkpoint to dictionary."""
     return {
@@ -81,7 +120,7 @@ def _dict_to_checkpoint(data: dict) -> Checkpoint:
         progress_file_hash=data.get("progress_file_hash", ""),
         session_state_hash=data.get("session_state_hash", ""),
         reason=data.get("reason", ""),
-        files_backed_up=data.get("files_backed_up", []),
+        files_backed_up=list(data.get("files_backed_up", [])),
     )
 
 
@@ -95,6 +134,45 @@ def _get_checkpoint_path(project_dir: Path, checkpoint_id: str) -> Path:
     return _get_checkpoint_dir(project_dir) / checkpoint_id
 
 
+def _get_blob_path(project_dir: Path, file_hash: str) -> Path:
+    """Get path for a backup blob in the shared content-addressed store."""
+    return _get_checkpoint_dir(project_dir) / "_blobs" / file_hash
+
+
+def _store_backup(project_dir: Path, source: Path, file_hash: str, dest: Path) -> None:
+    """
+    Back up a file into a checkpoint, sharing storage with identical backups.
+
+    Each distinct file content is stored once under checkpoints/_blobs, named
+    by its SHA256, and hard-linked into the checkpoint directory. Falls back
+    to a plain copy where hard links are not supported.
+    """
+    blob_path = _get_blob_path(project_dir, file_hash)
+    if not blob_path.exists():
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob_path.with_name(file_hash + ".tmp")
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, blob_path)
+
+    try:
+        os.link(blob_path, dest)
+    except OSError:
+        shutil.copy2(blob_path, dest)
+
+
+def _prune_blobs(project_dir: Path, file_hashes: list[str]) -> None:
+    """Remove blobs that are no longer linked from any checkpoint."""
+    for file_hash in file_hashes:
+        if not file_hash:
+            continue
+        blob_path = _get_blob_path(project_dir, file_hash)
+        try:
+            if blob_path.stat().st_nlink <= 1:
+                blob_path.unlink()
+        except FileNotFoundError:
+            continue
+
+
 def create_checkpoint(
     project_dir: Path,
     session: int,
@@ -132,10 +210,11 @@ def create_checkpoint(
     if state_dir is None:
         state_dir = project_dir / ".harness"
 
-    # Get git ref
-    git_ref = ""
-    if is_git_repo(project_dir):
+    # Get git ref (opens the repository once rather than probing it first)
+    try:
         git_ref = get_head_ref(project_dir)
+    except GitError:
+        git_ref = ""
 
     # Compute file hashes
     features_hash = _compute_file_hash(features_path)
@@ -147,25 +226,22 @@ def create_checkpoint(
     checkpoint_path.mkdir(parents=True, exist_ok=True)
 
     # Backup files
+    backups = [
+        ("features.json", features_path, features_hash),
+        ("claude-progress.txt", progress_path, progress_hash),
+        ("session_state.json", state_dir / "session_state.json", state_hash),
+    ]
     files_backed_up = []
 
-    if features_path.exists():
-        shutil.copy2(features_path, checkpoint_path / "features.json")
-        files_backed_up.append("features.json")
-
-    if progress_path.exists():
-        shutil.copy2(progress_path, checkpoint_path / "claude-progress.txt")
-        files_backed_up.append("claude-progress.txt")
-
-    state_file = state_dir / "session_state.json"
-    if state_file.exists():
-        shutil.copy2(state_file, checkpoint_path / "session_state.json")
-        files_backed_up.append("session_state.json")
+    for filename, source, file_hash in backups:
+        if file_hash:
+            _store_backup(project_dir, source, file_hash, checkpoint_path / filename)
+            files_backed_up.append(filename)
 
     # Create checkpoint object
     checkpoint = Checkpoint(
         id=checkpoint_id,
-        timestamp=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        timestamp=_utc_timestamp(),
         session=session,
         git_ref=git_ref,
         features_json_hash=features_hash,
@@ -176,9 +252,7 @@ def create_checkpoint(
     )
 
     # Save checkpoint metadata
-    metadata_path = checkpoint_path / "checkpoint.json"
-    with open(metadata_path, "w") as f:
-        json.dump(_checkpoint_to_dict(checkpoint), f, indent=2)
+    _atomic_write_json(checkpoint_path / "checkpoint.json", _checkpoint_to_dict(checkpoint))
 
     return checkpoint
 
@@ -225,11 +299,12 @@ def rollback_to_checkpoint(
     errors = []
     files_restored = []
     git_restored = False
+    git_ref_after = None
 
     # Restore git state
     if restore_git and checkpoint.git_ref and is_git_repo(project_dir):
         try:
-            reset_hard(project_dir, checkpoint.git_ref)
+            git_ref_after = reset_hard(project_dir, checkpoint.git_ref)
             git_restored = True
         except GitError as e:
             errors.append(f"Failed to restore git state: {e}")
@@ -264,6 +339,7 @@ def rollback_to_checkpoint(
         files_restored=files_restored,
         errors=errors,
         message="Rollback successful" if success else "Rollback completed with errors",
+        git_ref_after=git_ref_after,
     )
 
 
@@ -278,18 +354,37 @@ def get_checkpoint(project_dir: Path, checkpoint_id: str) -> Optional[Checkpoint
     Returns:
         Checkpoint object, or None if not found.
     """
-    checkpoint_path = _get_checkpoint_path(project_dir, checkpoint_id)
-    metadata_path = checkpoint_path / "checkpoint.json"
+    metadata_path = _get_checkpoint_path(project_dir, checkpoint_id) / "checkpoint.json"
+    data = _load_checkpoint_metadata(str(metadata_path))
 
-    if not metadata_path.exists():
+    if data is None:
         return None
 
-    with open(metadata_path) as f:
-        data = json.load(f)
-
     return _dict_to_checkpoint(data)
 
 
+def _load_checkpoints(project_dir: Path, name_prefix: str = "checkpoint-") -> list[Checkpoint]:
+    """Load checkpoints whose directory name starts with name_prefix, newest first."""
+    checkpoint_dir = _get_checkpoint_dir(project_dir)
+
+    try:
+        entries = list(os.scandir(checkpoint_dir))
+    except FileNotFoundError:
+        return []
+
+    checkpoints = []
+    for entry in entries:
+        if not entry.name.startswith(name_prefix) or not entry.is_dir():
+            continue
+        data = _load_checkpoint_metadata(os.path.join(entry.path, "checkpoint.json"))
+        if data is not None:
+            checkpoints.append(_dict_to_checkpoint(data))
+
+    # Sort by timestamp, newest first
+    checkpoints.sort(key=lambda c: c.timestamp, reverse=True)
+    return checkpoints
+
+
 def list_checkpoints(project_dir: Path) -> list[Checkpoint]:
     """
     List all checkpoints for a project.
@@ -300,29 +395,16 @@ def list_checkpoints(project_dir: Path) -> list[Checkpoint]:
     Returns:
         List of Checkpoint objects, newest first.
     """
-    checkpoint_dir = _get_checkpoint_dir(project_dir)
-
-    if not checkpoint_dir.exists():
-        return []
-
-    checkpoints = []
-    for item in checkpoint_dir.iterdir():
-        if item.is_dir():
-            metadata_path = item / "checkpoint.json"
-            if metadata_path.exists():
-                with open(metadata_path) as f:
-                    data = json.load(f)
-                checkpoints.append(_dict_to_checkpoint(data))
-
-    # Sort by timestamp, newest first
-    checkpoints.sort(key=lambda c: c.timestamp, reverse=True)
-    return checkpoints
+    return _load_checkpoints(project_dir)
 
 
 def list_checkpoints_for_session(project_dir: Path, session: int) -> list[Checkpoint]:
     """
     List checkpoints for a specific session.
 
+    Checkpoint IDs embed the session number, so directories belonging to
+    other sessions are skipped without reading their metadata.
+
     Args:
         project_dir: Path to the project directory.
         session: Session number.
@@ -330,8 +412,8 @@ def list_checkpoints_for_session(project_dir: Path, session: int) -> list[Checkp
     Returns:
         List of Checkpoint objects for the session.
     """
-    all_checkpoints = list_checkpoints(project_dir)
-    return [c for c in all_checkpoints if c.session == session]
+    checkpoints = _load_checkpoints(project_dir, f"checkpoint-{session}-")
+    return [c for c in checkpoints if c.session == session]
 
 
 def cleanup_old_checkpoints(
@@ -354,31 +436,24 @@ def cleanup_old_checkpoints(
     cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
     deleted = 0
 
-    # Group by session
-    by_session: dict[int, list[Checkpoint]] = {}
+    # Checkpoints are newest first, so the first keep_per_session seen for
+    # each session are the ones to keep. The timestamp in checkpoint.json is
+    # authoritative; file mtimes are not, since metadata may be rewritten.
+    kept_per_session: dict[int, int] = {}
     for cp in checkpoints:
-        if cp.session not in by_session:
-            by_session[cp.session] = []
-        by_session[cp.session].append(cp)
-
-    for session, session_checkpoints in by_session.items():
-        # Keep the most recent ones per session
-        to_keep = set()
-        for cp in session_checkpoints[:keep_per_session]:
-            to_keep.add(cp.id)
-
-        for cp in session_checkpoints:
-            if cp.id in to_keep:
-                continue
-
-            # Parse timestamp
-            try:
-                cp_time = datetime.fromisoformat(cp.timestamp.replace("Z", "+00:00"))
-                if cp_time < cutoff:
-                    delete_checkpoint(project_dir, cp.id)
-                    deleted += 1
-            except ValueError:
-                continue
+        kept = kept_per_session.get(cp.session, 0)
+        if kept < keep_per_session:
+            kept_per_session[cp.session] = kept + 1
+            continue
+
+        try:
+            cp_time = datetime.fromisoformat(cp.timestamp)
+        except ValueError:
+            continue
+
+        if cp_time < cutoff:
+            delete_checkpoint(project_dir, cp.id)
+            deleted += 1
 
     return deleted
 
@@ -395,11 +470,33 @@ def delete_checkpoint(project_dir: Path, checkpoint_id: str) -> bool:
         True if deleted, False if not found.
     """
     checkpoint_path = _get_checkpoint_path(project_dir, checkpoint_id)
-
-    if not checkpoint_path.exists():
+    metadata_path = str(checkpoint_path / "checkpoint.json")
+    # A checkpoint with unreadable metadata must still be deletable, even
+    # though its blob hashes are then unknown and nothing can be pruned
+    try:
+        data = _load_checkpoint_metadata(metadata_path)
+    except (ValueError, OSError):
+        data = None
+
+    # Let rmtree's own lstat detect a missing checkpoint rather than
+    # stat-ing the directory twice.
+    try:
+        shutil.rmtree(checkpoint_path)
+    except FileNotFoundError:
         return False
 
-    shutil.rmtree(checkpoint_path)
+    _metadata_cache.pop(metadata_path, None)
+
+    if isinstance(data, dict):
+        _prune_blobs(
+            project_dir,
+            [
+                data.get("features_json_hash", ""),
+                data.get("progress_file_hash", ""),
+                data.get("session_state_hash", ""),
+            ],
+        )
+
     return True
 
 
@@ -43,10 +43,36 @@ class HarnessContext:
 pass_context = click.make_pass_decorator(HarnessContext, ensure=True)
 
 
+# --- Command classes ---
+
+
+class HarnessCommand(click.Command):
+    """Command whose rendered help text is cached.
+
+    Help output only depends on the command tree, the invocation path and
+    the wrap width, so it is formatted once per combination.
+    """
+
+    def get_help(self, ctx: click.Context) -> str:
+        formatter = ctx.make_formatter()
+        key = (ctx.command_path, formatter.width)
+        cache = self.__dict__.setdefault("_help_cache", {})
+        if key not in cache:
+            self.format_help(ctx, formatter)
+            cache[key] = formatter.getvalue().rstrip("\n")
+        return cache[key]
+
+
+class HarnessGroup(HarnessCommand, click.Group):
+    """Command group with cached help whose subcommands also cache help."""
+
+    command_class = HarnessCommand
+
+
 # --- Main CLI group ---
 
 
-@click.group()
+@click.group(cls=HarnessGroup)
 @click.option(
     "--project-dir", "-p",
     type=click.Path(exists=True, file_okay=False, path_type=Path),
@@ -1199,6 +1225,7 @@ def sync(ctx: HarnessContext, create: bool, close: bool, status: bool):
             config.github,
             create_missing=create,
             close_completed=close,
+            check_auth=False,  # Already checked above
         )
 
         if result.success:
@@ -1,11 +1,14 @@
 """Configuration loading and validation for agent-harness."""
 
-from dataclasses import dataclass, field
+import copy
+import functools
+import hashlib
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-
 from agent_harness.exceptions import ConfigError, ConfigNotFoundError, ConfigValidationError
 
 
@@ -294,59 +297,118 @@ class Config:
 
 # --- Configuration loading functions ---
 
+# Validated configs keyed by .harness.yaml path, along with the file's
+# (inode, mtime, size) at load time. Callers always receive a copy.
+_config_cache: dict[str, tuple[tuple[int, int, int], Config]] = {}
 
-def _merge_dict(base: dict, override: dict) -> dict:
-    """Recursively merge override dict into base dict."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_dict(result[key], value)
-        else:
-            result[key] = value
-    return result
+# Parsed YAML keyed by a digest of the file contents, so identical configs
+# are parsed once even when rewritten or found in another project directory
+_PARSE_CACHE_SIZE = 64
+_parse_cache: OrderedDict[bytes, dict] = OrderedDict()
+
+# Digests of parse-cached contents that already passed _validate_config.
+# The resulting Config depends only on the file bytes, so re-validating
+# identical contents can be skipped.
+_validated_digests: set[bytes] = set()
+
+
+@functools.cache
+def _dataclass_field_types(cls: type) -> dict[str, Any]:
+    """Map a dataclass's field names to their declared types (computed once per class)."""
+    return {f.name: f.type for f in fields(cls)}
 
 
 def _dict_to_dataclass(cls: type, data: dict) -> Any:
-    """Convert a dictionary to a dataclass, handling nested dataclasses."""
+    """
+    Convert a dictionary to a dataclass, handling nested dataclasses.
+
+    Fields missing from data keep their dataclass defaults, so this single
+    walk over the parsed YAML also performs the merge with defaults.
+    """
     if data is None:
         return cls()
 
-    # Get field types from the dataclass
-    field_types = {}
-    for f in cls.__dataclass_fields__.values():
-        field_types[f.name] = f.type
+    field_types = _dataclass_field_types(cls)
 
-    # Process each field
     kwargs = {}
-    for field_name, field_type in field_types.items():
-        if field_name not in data:
+    for field_name, value in data.items():
+        if field_name not in field_types:
             continue
 
-        value = data[field_name]
+        # Recurse into nested dataclass sections
+        field_type = field_types[field_name]
+        if hasattr(field_type, "__dataclass_fields__") and isinstance(value, dict):
+            value = _dict_to_dataclass(field_type, value)
 
-        # Check if field_type is a dataclass
-        if hasattr(field_type, "__dataclass_fields__"):
-            if isinstance(value, dict):
-                kwargs[field_name] = _dict_to_dataclass(field_type, value)
-            else:
-                kwargs[field_name] = value
-        else:
-            kwargs[field_name] = value
+        kwargs[field_name] = value
 
     return cls(**kwargs)
 
 
-def _load_yaml_file(path: Path) -> dict:
-    """Load a YAML file and return its contents as a dictionary."""
-    if not path.exists():
-        raise ConfigNotFoundError(str(path))
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _copy_config(obj: Any) -> Any:
+    """Copy a config dataclass tree.
+
+    Immutable leaves are shared with the original and nested dataclasses are
+    copied field by field; only list and dict values fall back to deepcopy.
+    Much cheaper than ``copy.deepcopy`` on the whole tree, which pays memo
+    and reduce overhead for every node.
+    """
+    cls = type(obj)
+    new = cls.__new__(cls)
+    attrs = new.__dict__
+    for name, value in obj.__dict__.items():
+        if type(value) in _IMMUTABLE_TYPES:
+            attrs[name] = value
+        elif hasattr(type(value), "__dataclass_fields__"):
+            attrs[name] = _copy_config(value)
+        else:
+            attrs[name] = copy.deepcopy(value)
+    return new
+
+
+def _parse_yaml_bytes(raw: bytes, path: Path) -> dict:
+    """Parse raw YAML bytes read from path into a dictionary."""
+    import yaml
 
     try:
-        with open(path) as f:
-            content = yaml.safe_load(f)
-            return content if content else {}
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without LibYAML
+        from yaml import SafeLoader
+
+    # The loader decodes the bytes itself, avoiding an intermediate str
+    try:
+        content = yaml.load(raw, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in {path}: {e}")
+    return content if content else {}
+
+
+def _parse_config_bytes(raw: bytes, digest: bytes, path: Path) -> dict:
+    """Parse config file contents, reusing earlier parses of identical bytes.
+
+    Returns a private copy that the caller is free to modify.
+    """
+    cached = _parse_cache.get(digest)
+    if cached is not None:
+        _parse_cache.move_to_end(digest)
+        return copy.deepcopy(cached)
+
+    data = _parse_yaml_bytes(raw, path)
+    _parse_cache[digest] = copy.deepcopy(data)
+    if len(_parse_cache) > _PARSE_CACHE_SIZE:
+        evicted, _ = _parse_cache.popitem(last=False)
+        _validated_digests.discard(evicted)
+    return data
+
+
+# Allowed values for enumerated config fields
+_VALID_LOG_LEVELS = frozenset({"critical", "important", "routine", "debug"})
+_VALID_SYNC_MODES = frozenset({"mirror", "none"})
+_VALID_OLDER_STATE_MODES = frozenset({"migrate", "abort"})
+_VALID_NEWER_STATE_MODES = frozenset({"abort", "warn"})
 
 
 def _validate_config(config: Config) -> None:
@@ -398,26 +460,23 @@ def _validate_config(config: Config) -> None:
         )
 
     # Validate logging level
-    valid_levels = {"critical", "important", "routine", "debug"}
-    if config.logging.level not in valid_levels:
+    if config.logging.level not in _VALID_LOG_LEVELS:
         raise ConfigValidationError(
-            "logging.level", f"Must be one of: {', '.join(valid_levels)}"
+            "logging.level", f"Must be one of: {', '.join(sorted(_VALID_LOG_LEVELS))}"
         )
 
     # Validate github sync_mode
-    valid_sync_modes = {"mirror", "none"}
-    if config.github.sync_mode not in valid_sync_modes:
+    if config.github.sync_mode not in _VALID_SYNC_MODES:
         raise ConfigValidationError(
-            "github.sync_mode", f"Must be one of: {', '.join(valid_sync_modes)}"
+            "github.sync_mode", f"Must be one of: {', '.join(sorted(_VALID_SYNC_MODES))}"
         )
 
     # Validate compatibility modes
-    valid_state_modes = {"migrate", "abort", "warn"}
-    if config.compatibility.on_older_state not in {"migrate", "abort"}:
+    if config.compatibility.on_older_state not in _VALID_OLDER_STATE_MODES:
         raise ConfigValidationError(
             "compatibility.on_older_state", "Must be 'migrate' or 'abort'"
         )
-    if config.compatibility.on_newer_state not in {"abort", "warn"}:
+    if config.compatibility.on_newer_state not in _VALID_NEWER_STATE_MODES:
         raise ConfigValidationError(
             "compatibility.on_newer_state", "Must be 'abort' or 'warn'"
         )
@@ -444,11 +503,30 @@ def load_config(project_dir: Optional[Path] = None) -> Config:
 
     config_path = project_dir / ".harness.yaml"
 
-    # Load config file if it exists, otherwise use defaults
-    if config_path.exists():
-        config_data = _load_yaml_file(config_path)
-    else:
-        config_data = {}
+    # Reuse the validated config while the file is unchanged on disk
+    cache_key = str(config_path)
+    try:
+        st = os.stat(config_path)
+    except (FileNotFoundError, NotADirectoryError):
+        _config_cache.pop(cache_key, None)
+        st = None
+
+    # Without a config file the defaults apply unchanged; they are known to
+    # be valid, so skip the merge and validation passes entirely.
+    if st is None:
+        return get_default_config()
+
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return _copy_config(cached[1])
+
+    try:
+        raw = config_path.read_bytes()
+    except FileNotFoundError:
+        raise ConfigNotFoundError(str(config_path))
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    config_data = _parse_config_bytes(raw, digest, config_path)
 
     # Convert to Config dataclass with defaults
     config = _dict_to_dataclass(Config, config_data)
@@ -460,8 +538,13 @@ def load_config(project_dir: Optional[Path] = None) -> Config:
     if "budget_total" in costs_data:
         config.costs.total_project_usd = costs_data["budget_total"]
 
-    # Validate
-    _validate_config(config)
+    # Validate, unless these exact contents have passed before
+    if digest not in _validated_digests:
+        _validate_config(config)
+        if digest in _parse_cache:
+            _validated_digests.add(digest)
+
+    _config_cache[cache_key] = (stamp, _copy_config(config))
 
     return config
 
@@ -479,6 +562,8 @@ def save_config(config: Config, project_dir: Path) -> None:
         config: Config object to save.
         project_dir: Path to the project directory.
     """
+    import yaml
+
     config_path = project_dir / ".harness.yaml"
 
     # Convert dataclass to dict
@@ -23,7 +23,21 @@ MODEL_CONTEXT_WINDOWS = {
 }
 
 
-@dataclass
+# The hard stop text has no usage figures in it, so it is built once
+_HARD_STOP_MESSAGE = """
+HARD STOP: CONTEXT WINDOW EXCEEDED
+==================================
+The context window has been exceeded.
+This session must end NOW.
+
+FINAL ACTIONS:
+1. Save all work immediately
+2. Do not start any new operations
+3. The session will terminate after this message
+"""
+
+
+@dataclass(slots=True)
 class ContextStatus:
     """Current context window status."""
 
@@ -35,7 +49,7 @@ class ContextStatus:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextWarning:
     """A context warning to inject into conversation."""
 
@@ -69,20 +83,18 @@ class ContextManager:
         self.warning_threshold = warning_threshold
         self.critical_threshold = critical_threshold
         self.reserve_tokens = reserve_tokens
+        # Usable context window (minus reserve); fixed for the manager's lifetime
+        self.usable_tokens = self.context_window - reserve_tokens
 
         self.tokens_used = 0
         self.warning_issued = False
         self.critical_issued = False
 
-    @property
-    def usable_tokens(self) -> int:
-        """Get the usable context window (minus reserve)."""
-        return self.context_window - self.reserve_tokens
-
     @property
     def percentage_used(self) -> float:
         """Get percentage of context used."""
-        return self.tokens_used / self.usable_tokens if self.usable_tokens > 0 else 1.0
+        usable = self.usable_tokens
+        return self.tokens_used / usable if usable > 0 else 1.0
 
     @property
     def tokens_remaining(self) -> int:
@@ -143,10 +155,17 @@ class ContextManager:
         if percentage >= 1.0:
             return ContextWarning(
                 level="hard_stop",
-                message=self._build_hard_stop_message(),
+                message=_HARD_STOP_MESSAGE,
                 force_action=True,
             )
 
+        # Common case: below both thresholds, or both warnings already issued
+        if (self.critical_issued and self.warning_issued) or (
+            percentage < self.warning_threshold
+            and percentage < self.critical_threshold
+        ):
+            return None
+
         # Critical (only once)
         if percentage >= self.critical_threshold and not self.critical_issued:
             self.critical_issued = True
@@ -205,17 +224,7 @@ The session will be terminated soon.
 
     def _build_hard_stop_message(self) -> str:
         """Build the 100% hard stop message."""
-        return """
-HARD STOP: CONTEXT WINDOW EXCEEDED
-==================================
-The context window has been exceeded.
-This session must end NOW.
-
-FINAL ACTIONS:
-1. Save all work immediately
-2. Do not start any new operations
-3. The session will terminate after this message
-"""
+        return _HARD_STOP_MESSAGE
 
     def can_continue(self) -> bool:
         """Check if the session can continue.
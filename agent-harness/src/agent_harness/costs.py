@@ -4,13 +4,12 @@ Tracks token usage and costs per session and per feature.
 """
 
 import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from agent_harness.config import CostsConfig
 from agent_harness.exceptions import BudgetExceededError, StateError
 
@@ -30,8 +29,16 @@ MODEL_PRICING = {
     "default": {"input": 3.00, "output": 15.00, "cached": 0.30},
 }
 
+# (input, output, cached) rates per model, flattened from MODEL_PRICING so
+# calculate_cost does a single lookup per call
+_PRICING_RATES = {
+    model: (pricing["input"], pricing["output"], pricing["cached"])
+    for model, pricing in MODEL_PRICING.items()
+}
+_DEFAULT_RATES = _PRICING_RATES["default"]
+
 
-@dataclass
+@dataclass(slots=True)
 class SessionCost:
     """Cost tracking for a single session."""
 
@@ -47,6 +54,11 @@ class SessionCost:
     model: str = "claude-sonnet-4"
     feature_id: Optional[int] = None
 
+    def __post_init__(self):
+        """Intern the model name so history entries share one string per model."""
+        if self.model:
+            self.model = sys.intern(self.model)
+
 
 @dataclass
 class BudgetCheck:
@@ -60,7 +72,7 @@ class BudgetCheck:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CostTracker:
     """Tracks costs across sessions and features."""
 
@@ -151,19 +163,29 @@ def load_costs(path: Path) -> CostTracker:
     if not path.exists():
         return CostTracker()
 
+    content = path.read_text()
+
+    # Costs are saved as JSON (itself valid YAML); older files may be YAML.
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
-    except yaml.YAMLError as e:
-        raise StateError(f"Invalid YAML in costs file: {e}")
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        import yaml
 
-    return _dict_to_tracker(data)
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise StateError(f"Invalid YAML in costs file: {e}")
+
+    return _dict_to_tracker(data or {})
 
 
 def save_costs(path: Path, costs: CostTracker) -> None:
     """
     Save cost tracker to file.
 
+    The data is written as JSON, which is much faster to emit and parse than
+    YAML while remaining readable by any YAML parser.
+
     Args:
         path: Path to costs.yaml file.
         costs: CostTracker object to save.
@@ -172,7 +194,7 @@ def save_costs(path: Path, costs: CostTracker) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(path, "w") as f:
-        yaml.dump(_tracker_to_dict(costs), f, default_flow_style=False, sort_keys=False)
+        json.dump(_tracker_to_dict(costs), f, indent=2)
 
 
 def calculate_cost(
@@ -193,14 +215,12 @@ def calculate_cost(
     Returns:
         Cost in USD.
     """
-    pricing = MODEL_PRICING.get(model, MODEL_PRICING["default"])
+    input_rate, output_rate, cached_rate = _PRICING_RATES.get(model, _DEFAULT_RATES)
 
-    # Calculate cost (pricing is per 1M tokens)
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
-    cached_cost = (cached_tokens / 1_000_000) * pricing["cached"]
-
-    return input_cost + output_cost + cached_cost
+    # Pricing is per 1M tokens
+    return (
+        input_tokens * input_rate + output_tokens * output_rate + cached_tokens * cached_rate
+    ) / 1_000_000
 
 
 def add_usage(
@@ -220,18 +240,19 @@ def add_usage(
         cached_tokens: Number of cached input tokens.
         model: Model name for cost calculation.
     """
-    if costs.current_session is None:
+    session = costs.current_session
+    if session is None:
         raise StateError("No active session. Call start_session first.")
 
-    # Update session tokens
-    costs.current_session.tokens_input += input_tokens
-    costs.current_session.tokens_output += output_tokens
-    costs.current_session.tokens_cached += cached_tokens
-    costs.current_session.model = model
-
     # Calculate incremental cost
     incremental_cost = calculate_cost(input_tokens, output_tokens, cached_tokens, model)
-    costs.current_session.cost_usd += incremental_cost
+
+    # Update session tokens and cost
+    session.tokens_input += input_tokens
+    session.tokens_output += output_tokens
+    session.tokens_cached += cached_tokens
+    session.cost_usd += incremental_cost
+    session.model = sys.intern(model)
 
     # Update totals
     costs.total_tokens_input += input_tokens
@@ -240,9 +261,10 @@ def add_usage(
     costs.total_cost_usd += incremental_cost
 
     # Update feature cost if applicable
-    if costs.current_session.feature_id is not None:
-        feature_id = costs.current_session.feature_id
-        costs.by_feature[feature_id] = costs.by_feature.get(feature_id, 0.0) + incremental_cost
+    feature_id = session.feature_id
+    if feature_id is not None:
+        by_feature = costs.by_feature
+        by_feature[feature_id] = by_feature.get(feature_id, 0.0) + incremental_cost
 
 
 def start_session(
@@ -313,9 +335,12 @@ def check_budget(costs: CostTracker, config: CostsConfig) -> BudgetCheck:
     Returns:
         BudgetCheck result.
     """
+    # Limits are checked cheapest-first and the first exceeded one is returned
+    session = costs.current_session
+
     # Check session budget
-    if costs.current_session:
-        session_cost = costs.current_session.cost_usd
+    if session:
+        session_cost = session.cost_usd
         if session_cost >= config.per_session_usd:
             return BudgetCheck(
                 within_budget=False,
@@ -327,8 +352,8 @@ def check_budget(costs: CostTracker, config: CostsConfig) -> BudgetCheck:
             )
 
         # Check feature budget if applicable
-        if costs.current_session.feature_id is not None:
-            feature_id = costs.current_session.feature_id
+        feature_id = session.feature_id
+        if feature_id is not None:
             feature_cost = costs.by_feature.get(feature_id, 0.0)
             if feature_cost >= config.per_feature_usd:
                 return BudgetCheck(
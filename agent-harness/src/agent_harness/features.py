@@ -1,7 +1,7 @@
 """Features schema and operations for agent-harness."""
 
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -9,7 +9,12 @@ from typing import Any, Optional
 from agent_harness.exceptions import StateError
 
 
-@dataclass
+# Allowed values for enumerated Feature fields
+_VALID_SIZE_ESTIMATES = frozenset({"small", "medium", "large"})
+_VALID_VERIFICATION_TYPES = frozenset({"automated", "hybrid", "manual"})
+
+
+@dataclass(slots=True)
 class Feature:
     """A single feature in the features file."""
 
@@ -31,11 +36,11 @@ class Feature:
             raise StateError(f"Feature {self.id} missing required test_file")
         if not self.description:
             raise StateError(f"Feature {self.id} missing required description")
-        if self.size_estimate not in ("small", "medium", "large"):
+        if self.size_estimate not in _VALID_SIZE_ESTIMATES:
             raise StateError(
                 f"Feature {self.id} has invalid size_estimate: {self.size_estimate}"
             )
-        if self.verification_type not in ("automated", "hybrid", "manual"):
+        if self.verification_type not in _VALID_VERIFICATION_TYPES:
             raise StateError(
                 f"Feature {self.id} has invalid verification_type: {self.verification_type}"
             )
@@ -50,6 +55,10 @@ class FeaturesFile:
     init_mode: str  # "new" or "adopt"
     last_updated: str
     features: list[Feature] = field(default_factory=list)
+    # (len(features), {id: position}) built lazily by get_feature_by_id
+    _id_index: Optional[tuple[int, dict[int, int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate features file."""
@@ -87,7 +96,21 @@ def _dict_to_feature(data: dict) -> Feature:
 
 def _feature_to_dict(feature: Feature) -> dict:
     """Convert a Feature dataclass to a dictionary."""
-    return asdict(feature)
+    # Built field by field; dataclasses.asdict recurses and deep-copies every
+    # value, which dominates save time for large features files.
+    return {
+        "id": feature.id,
+        "category": feature.category,
+        "description": feature.description,
+        "test_file": feature.test_file,
+        "verification_steps": list(feature.verification_steps),
+        "size_estimate": feature.size_estimate,
+        "depends_on": list(feature.depends_on),
+        "passes": feature.passes,
+        "origin": feature.origin,
+        "verification_type": feature.verification_type,
+        "note": feature.note,
+    }
 
 
 def load_features(path: Path) -> FeaturesFile:
@@ -103,12 +126,10 @@ def load_features(path: Path) -> FeaturesFile:
     Raises:
         StateError: If file is missing or invalid.
     """
-    if not path.exists():
-        raise StateError(f"Features file not found: {path}")
-
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        raise StateError(f"Features file not found: {path}")
     except json.JSONDecodeError as e:
         raise StateError(f"Invalid JSON in features file: {e}")
 
@@ -148,8 +169,8 @@ def save_features(path: Path, features_file: FeaturesFile) -> None:
         "features": [_feature_to_dict(f) for f in features_file.features],
     }
 
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    # Encode in one go and write once, rather than a write per JSON token
+    path.write_text(json.dumps(data, indent=2))
 
 
 def get_next_feature(features_file: FeaturesFile) -> Optional[Feature]:
@@ -170,7 +191,7 @@ def get_next_feature(features_file: FeaturesFile) -> Optional[Feature]:
         if feature.passes:
             continue
         # Check if all dependencies are satisfied
-        if all(dep_id in passing_ids for dep_id in feature.depends_on):
+        if passing_ids.issuperset(feature.depends_on):
             return feature
 
     return None
@@ -187,8 +208,22 @@ def get_feature_by_id(features_file: FeaturesFile, feature_id: int) -> Optional[
     Returns:
         Feature with matching ID, or None if not found.
     """
-    for feature in features_file.features:
+    features = features_file.features
+    index = features_file._id_index
+    if index is None or index[0] != len(features):
+        positions: dict[int, int] = {}
+        for i, feature in enumerate(features):
+            positions.setdefault(feature.id, i)
+        index = features_file._id_index = (len(features), positions)
+
+    i = index[1].get(feature_id)
+    if i is not None and features[i].id == feature_id:
+        return features[i]
+
+    # The index may be stale if features were replaced or renumbered in place
+    for feature in features:
         if feature.id == feature_id:
+            features_file._id_index = None
             return feature
     return None
 
@@ -229,46 +264,93 @@ def detect_dependency_cycles(features: list[Feature]) -> list[list[int]]:
     """
     Detect dependency cycles in features.
 
-    Uses depth-first search to find cycles.
+    Finds strongly connected components with an iterative Tarjan pass, so
+    long dependency chains cannot exhaust the recursion limit. One cycle is
+    reported per component with more than one feature, plus one for each
+    feature that depends on itself.
 
     Args:
         features: List of Feature objects.
 
     Returns:
-        List of cycles, where each cycle is a list of feature IDs.
+        List of cycles, where each cycle is a list of feature IDs that starts
+        and ends with the same ID.
     """
-    # Build adjacency list
-    adj = {f.id: f.depends_on for f in features}
-    all_ids = set(adj.keys())
-
-    # Track visited state
-    WHITE, GRAY, BLACK = 0, 1, 2
-    color = {fid: WHITE for fid in all_ids}
-    parent = {fid: None for fid in all_ids}
+    # Build adjacency list over integer indices, skipping invalid dependencies
+    deps_by_id = {f.id: f.depends_on for f in features}
+    ids = list(deps_by_id)
+    id_to_idx = {fid: i for i, fid in enumerate(ids)}
+    adj = [
+        [id_to_idx[d] for d in deps if d in id_to_idx] for deps in deps_by_id.values()
+    ]
+
+    n = len(ids)
+    index = [-1] * n
+    lowlink = [0] * n
+    on_stack = bytearray(n)
+    scc_stack: list[int] = []
     cycles = []
+    counter = 0
 
-    def dfs(node: int, path: list[int]) -> None:
-        color[node] = GRAY
-
-        for neighbor in adj.get(node, []):
-            if neighbor not in all_ids:
-                continue  # Skip invalid dependencies
+    for root in range(n):
+        if index[root] != -1:
+            continue
 
-            if color[neighbor] == GRAY:
-                # Found a cycle - extract it
-                cycle_start = path.index(neighbor)
-                cycle = path[cycle_start:] + [neighbor]
-                cycles.append(cycle)
-            elif color[neighbor] == WHITE:
-                dfs(neighbor, path + [neighbor])
+        # Each work item is (node, position of the next edge to visit)
+        work = [(root, 0)]
+        while work:
+            v, pos = work.pop()
+            if pos == 0:
+                index[v] = lowlink[v] = counter
+                counter += 1
+                scc_stack.append(v)
+                on_stack[v] = 1
+
+            edges = adj[v]
+            while pos < len(edges):
+                w = edges[pos]
+                pos += 1
+                if index[w] == -1:
+                    # Descend into w; resume v at the next edge afterwards
+                    work.append((v, pos))
+                    work.append((w, 0))
+                    break
+                if on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+            else:
+                # All edges of v visited
+                if lowlink[v] == index[v]:
+                    component = []
+                    while True:
+                        w = scc_stack.pop()
+                        on_stack[w] = 0
+                        component.append(w)
+                        if w == v:
+                            break
+                    if len(component) > 1:
+                        cycles.append(_cycle_in_component(v, set(component), adj, ids))
+                    cycles.extend([ids[w], ids[w]] for w in component if w in adj[w])
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[v] < lowlink[parent]:
+                        lowlink[parent] = lowlink[v]
 
-        color[node] = BLACK
+    return cycles
 
-    for fid in all_ids:
-        if color[fid] == WHITE:
-            dfs(fid, [fid])
 
-    return cycles
+def _cycle_in_component(
+    start: int, component: set[int], adj: list[list[int]], ids: list[int]
+) -> list[int]:
+    """Walk dependency edges inside a component until a feature repeats."""
+    path = [start]
+    seen = {start: 0}
+    node = start
+    while True:
+        node = next(w for w in adj[node] if w in component and w != node)
+        if node in seen:
+            return [ids[i] for i in path[seen[node]:]] + [ids[node]]
+        seen[node] = len(path)
+        path.append(node)
 
 
 def validate_features(
@@ -284,47 +366,53 @@ def validate_features(
     Returns:
         ValidationResult with errors and warnings.
     """
+    features = features_file.features
     errors = []
     warnings = []
 
     # Check for duplicate IDs
-    ids = [f.id for f in features_file.features]
-    duplicates = [fid for fid in ids if ids.count(fid) > 1]
+    valid_ids = set()
+    duplicates = set()
+    for feature in features:
+        if feature.id in valid_ids:
+            duplicates.add(feature.id)
+        else:
+            valid_ids.add(feature.id)
     if duplicates:
-        errors.append(f"Duplicate feature IDs: {set(duplicates)}")
+        errors.append(f"Duplicate feature IDs: {duplicates}")
 
     # Check for dependency cycles
-    cycles = detect_dependency_cycles(features_file.features)
-    if cycles:
-        for cycle in cycles:
-            errors.append(f"Dependency cycle detected: {' -> '.join(map(str, cycle))}")
-
-    # Check for invalid dependencies
-    valid_ids = set(ids)
-    for feature in features_file.features:
-        invalid_deps = [d for d in feature.depends_on if d not in valid_ids]
-        if invalid_deps:
-            errors.append(
+    for cycle in detect_dependency_cycles(features):
+        errors.append(f"Dependency cycle detected: {' -> '.join(map(str, cycle))}")
+
+    # Per-feature checks in a single pass; findings are grouped by kind so
+    # the reported order matches checking each kind separately
+    invalid_dep_errors = []
+    missing_test_errors = []
+    self_dep_errors = []
+    for feature in features:
+        depends_on = feature.depends_on
+        if depends_on and not valid_ids.issuperset(depends_on):
+            invalid_deps = [d for d in depends_on if d not in valid_ids]
+            invalid_dep_errors.append(
                 f"Feature {feature.id} depends on non-existent features: {invalid_deps}"
             )
-
-    # Check for missing test files (warning)
-    for feature in features_file.features:
         if not feature.test_file:
-            errors.append(f"Feature {feature.id} missing test_file")
+            missing_test_errors.append(f"Feature {feature.id} missing test_file")
+        if feature.id in depends_on:
+            self_dep_errors.append(f"Feature {feature.id} depends on itself")
 
-    # Check for excessive verification steps (warning)
-    for feature in features_file.features:
-        if len(feature.verification_steps) > max_verification_steps:
+        # Excessive verification steps (warning)
+        step_count = len(feature.verification_steps)
+        if step_count > max_verification_steps:
             warnings.append(
-                f"Feature {feature.id} has {len(feature.verification_steps)} verification steps "
+                f"Feature {feature.id} has {step_count} verification steps "
                 f"(max recommended: {max_verification_steps})"
             )
 
-    # Check for self-dependencies (error)
-    for feature in features_file.features:
-        if feature.id in feature.depends_on:
-            errors.append(f"Feature {feature.id} depends on itself")
+    errors.extend(invalid_dep_errors)
+    errors.extend(missing_test_errors)
+    errors.extend(self_dep_errors)
 
     return ValidationResult(
         valid=len(errors) == 0,
@@ -362,7 +450,7 @@ def get_feature_progress(features_file: FeaturesFile) -> tuple[int, int, float]:
         Tuple of (passing_count, total_count, percentage).
     """
     total = len(features_file.features)
-    passing = len([f for f in features_file.features if f.passes])
+    passing = sum(1 for f in features_file.features if f.passes)
     percentage = (passing / total * 100) if total > 0 else 0.0
     return passing, total, percentage
 
@@ -380,7 +468,7 @@ def get_blocked_features(features_file: FeaturesFile) -> list[Feature]:
     for feature in features_file.features:
         if feature.passes:
             continue
-        if feature.depends_on and not all(d in passing_ids for d in feature.depends_on):
+        if feature.depends_on and not passing_ids.issuperset(feature.depends_on):
             blocked.append(feature)
 
     return blocked
@@ -399,7 +487,7 @@ def get_ready_features(features_file: FeaturesFile) -> list[Feature]:
     for feature in features_file.features:
         if feature.passes:
             continue
-        if all(d in passing_ids for d in feature.depends_on):
+        if passing_ids.issuperset(feature.depends_on):
             ready.append(feature)
 
     return ready
@@ -80,7 +80,9 @@ def is_working_tree_clean(project_dir: Path) -> bool:
         True if working tree is clean.
     """
     repo = get_repo(project_dir)
-    return not repo.is_dirty(untracked_files=True)
+    # One status call; Repo.is_dirty runs separate index, worktree and
+    # untracked-file commands
+    return not repo.git.status("--porcelain", "--untracked-files=normal")
 
 
 def is_detached_head(project_dir: Path) -> bool:
@@ -148,7 +150,7 @@ def commits_between(project_dir: Path, from_ref: str, to_ref: str) -> list[str]:
         raise GitError(f"Invalid git reference: {e}")
 
 
-def reset_hard(project_dir: Path, ref: str) -> None:
+def reset_hard(project_dir: Path, ref: str) -> str:
     """
     Perform a hard reset to the specified reference.
 
@@ -158,6 +160,9 @@ def reset_hard(project_dir: Path, ref: str) -> None:
         project_dir: Path to the project directory.
         ref: Reference to reset to (commit SHA, branch, tag).
 
+    Returns:
+        HEAD commit SHA after the reset.
+
     Raises:
         GitError: If reset fails.
     """
@@ -168,6 +173,8 @@ def reset_hard(project_dir: Path, ref: str) -> None:
     except (BadName, GitCommandError) as e:
         raise GitError(f"Failed to reset to {ref}: {e}")
 
+    return repo.head.commit.hexsha
+
 
 def create_commit(
     project_dir: Path,
@@ -269,24 +276,20 @@ def get_changed_files(project_dir: Path, staged: bool = False) -> list[str]:
     repo = get_repo(project_dir)
 
     if staged:
-        # Get staged files
-        return [item.a_path for item in repo.index.diff("HEAD")]
+        # Get staged files straight from git; IndexFile.diff parses the
+        # whole index in Python first. Output is NUL-separated and sorted.
+        output = repo.git.diff("--cached", "--name-only", "-z", "--no-renames")
+        return [path for path in output.split("\0") if path]
     else:
-        # Get all changed files (staged + unstaged + untracked)
-        changed = set()
-
-        # Staged changes
-        for item in repo.index.diff("HEAD"):
-            changed.add(item.a_path)
-
-        # Unstaged changes
-        for item in repo.index.diff(None):
-            changed.add(item.a_path)
-
-        # Untracked files
-        changed.update(repo.untracked_files)
-
-        return sorted(list(changed))
+        # Get all changed files (staged + unstaged + untracked) from a single
+        # status call. Entries are "XY path", NUL-separated; renames are
+        # reported as a deletion plus an addition.
+        output = repo.git.status(
+            "--porcelain", "-z", "--no-renames", "--untracked-files=all"
+        )
+        changed = {entry[3:] for entry in output.split("\0") if entry}
+
+        return sorted(changed)
 
 
 def get_untracked_files(project_dir: Path) -> list[str]:
@@ -4,6 +4,8 @@ Syncs features to GitHub Issues.
 """
 
 import json
+import os
+import re
 import subprocess
 import time
 from dataclasses import dataclass, field
@@ -14,7 +16,26 @@ from agent_harness.config import GithubConfig
 from agent_harness.features import Feature, FeaturesFile
 
 
-@dataclass
+# Environment overrides for every gh call: skip the release check (a network
+# request on the critical path) and never wait on an interactive prompt
+_GH_ENV_OVERRIDES = {"GH_NO_UPDATE_NOTIFIER": "1", "GH_PROMPT_DISABLED": "1"}
+
+# Set once 'gh auth status' has succeeded in this process
+_gh_authenticated = False
+
+# Successful 'gh repo view' lookups, keyed by the working directory gh ran in
+_repo_info_cache: dict[str, tuple[str, str]] = {}
+
+# Feature tag embedded in issue titles, e.g. "[Feature #12] Add login"
+_FEATURE_TAG = "[Feature #{}]".format
+_FEATURE_TAG_RE = re.compile(r"\[Feature #(\d+)\]")
+
+# gh --json field lists; the summary omits the bodies sync never reads
+_ISSUE_FIELDS = "number,title,state,labels,body,url"
+_ISSUE_SUMMARY_FIELDS = "number,title,state,labels"
+
+
+@dataclass(slots=True)
 class GitHubIssue:
     """A GitHub issue."""
 
@@ -26,7 +47,7 @@ class GitHubIssue:
     url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of a sync operation."""
 
@@ -38,6 +59,18 @@ class SyncResult:
     message: str = ""
 
 
+def _dict_to_issue(item: dict) -> GitHubIssue:
+    """Convert an issue object from gh's JSON output to a GitHubIssue."""
+    return GitHubIssue(
+        number=item.get("number", 0),
+        title=item.get("title", ""),
+        state=item.get("state", "").lower(),
+        labels=[label.get("name", "") for label in item.get("labels", ())],
+        body=item.get("body"),
+        url=item.get("url"),
+    )
+
+
 def _run_gh_command(args: list[str], timeout: int = 30) -> tuple[bool, str, str]:
     """
     Run a gh CLI command.
@@ -56,6 +89,7 @@ def _run_gh_command(args: list[str], timeout: int = 30) -> tuple[bool, str, str]
             capture_output=True,
             text=True,
             timeout=timeout,
+            env={**os.environ, **_GH_ENV_OVERRIDES},
         )
         return result.returncode == 0, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
@@ -68,10 +102,18 @@ def check_gh_auth() -> bool:
     """
     Check if gh CLI is authenticated.
 
+    A successful check is remembered for the rest of the process; a failed
+    one is retried on the next call so a later 'gh auth login' is seen.
+
     Returns:
         True if authenticated.
     """
+    global _gh_authenticated
+    if _gh_authenticated:
+        return True
+
     success, _, _ = _run_gh_command(["auth", "status"])
+    _gh_authenticated = success
     return success
 
 
@@ -79,24 +121,36 @@ def get_repo_info() -> Optional[tuple[str, str]]:
     """
     Get the current repo owner and name.
 
+    gh resolves the repo from the working directory, so results are
+    remembered per directory. Failures are not remembered.
+
     Returns:
         Tuple of (owner, repo) or None if not in a repo.
     """
+    cwd = os.getcwd()
+    cached = _repo_info_cache.get(cwd)
+    if cached is not None:
+        return cached
+
     success, stdout, _ = _run_gh_command(["repo", "view", "--json", "owner,name"])
     if not success:
         return None
 
     try:
         data = json.loads(stdout)
-        return data.get("owner", {}).get("login"), data.get("name")
     except json.JSONDecodeError:
         return None
 
+    info = data.get("owner", {}).get("login"), data.get("name")
+    _repo_info_cache[cwd] = info
+    return info
+
 
 def list_issues(
     label: Optional[str] = None,
     state: str = "all",
     limit: int = 100,
+    include_body: bool = True,
 ) -> list[GitHubIssue]:
     """
     List issues in the repository.
@@ -105,11 +159,14 @@ def list_issues(
         label: Filter by label.
         state: Issue state ("open", "closed", "all").
         limit: Maximum issues to return.
+        include_body: Fetch each issue's body and URL. When False they are
+            left as None, which keeps the gh response small.
 
     Returns:
         List of GitHubIssue objects.
     """
-    args = ["issue", "list", "--json", "number,title,state,labels,body,url", "--limit", str(limit)]
+    fields = _ISSUE_FIELDS if include_body else _ISSUE_SUMMARY_FIELDS
+    args = ["issue", "list", "--json", fields, "--limit", str(limit)]
 
     if label:
         args.extend(["--label", label])
@@ -122,19 +179,7 @@ def list_issues(
         return []
 
     try:
-        data = json.loads(stdout)
-        issues = []
-        for item in data:
-            labels = [l.get("name", "") for l in item.get("labels", [])]
-            issues.append(GitHubIssue(
-                number=item.get("number", 0),
-                title=item.get("title", ""),
-                state=item.get("state", "").lower(),
-                labels=labels,
-                body=item.get("body"),
-                url=item.get("url"),
-            ))
-        return issues
+        return [_dict_to_issue(item) for item in json.loads(stdout)]
     except json.JSONDecodeError:
         return []
 
@@ -149,23 +194,14 @@ def get_issue(issue_number: int) -> Optional[GitHubIssue]:
     Returns:
         GitHubIssue object or None.
     """
-    args = ["issue", "view", str(issue_number), "--json", "number,title,state,labels,body,url"]
+    args = ["issue", "view", str(issue_number), "--json", _ISSUE_FIELDS]
     success, stdout, _ = _run_gh_command(args)
 
     if not success:
         return None
 
     try:
-        item = json.loads(stdout)
-        labels = [l.get("name", "") for l in item.get("labels", [])]
-        return GitHubIssue(
-            number=item.get("number", 0),
-            title=item.get("title", ""),
-            state=item.get("state", "").lower(),
-            labels=labels,
-            body=item.get("body"),
-            url=item.get("url"),
-        )
+        return _dict_to_issue(json.loads(stdout))
     except json.JSONDecodeError:
         return None
 
@@ -184,7 +220,7 @@ def create_issue_for_feature(
     Returns:
         Issue number or None if failed.
     """
-    title = f"[Feature #{feature.id}] {feature.description}"
+    title = f"{_FEATURE_TAG(feature.id)} {feature.description}"
 
     # Build body
     body_parts = [
@@ -263,26 +299,34 @@ def close_issue(
     Returns:
         True if successful.
     """
-    # Add comment if provided
+    # Close the issue, leaving the comment in the same gh invocation
+    args = ["issue", "close", str(issue_number)]
     if comment:
-        _run_gh_command(["issue", "comment", str(issue_number), "--body", comment])
+        args.extend(["--comment", comment])
 
-    # Close the issue
-    success, _, _ = _run_gh_command(["issue", "close", str(issue_number)])
+    success, _, _ = _run_gh_command(args)
     return success
 
 
-def reopen_issue(issue_number: int) -> bool:
+def reopen_issue(
+    issue_number: int,
+    comment: Optional[str] = None,
+) -> bool:
     """
     Reopen a GitHub issue.
 
     Args:
         issue_number: Issue number to reopen.
+        comment: Optional comment to add.
 
     Returns:
         True if successful.
     """
-    success, _, _ = _run_gh_command(["issue", "reopen", str(issue_number)])
+    args = ["issue", "reopen", str(issue_number)]
+    if comment:
+        args.extend(["--comment", comment])
+
+    success, _, _ = _run_gh_command(args)
     return success
 
 
@@ -315,19 +359,42 @@ def find_issue_for_feature(
     Returns:
         Matching issue or None.
     """
-    pattern = f"[Feature #{feature_id}]"
+    pattern = _FEATURE_TAG(feature_id)
     for issue in issues:
         if pattern in issue.title:
             return issue
     return None
 
 
+def _index_issues(issues: list[GitHubIssue]) -> dict[int, GitHubIssue]:
+    """
+    Map feature IDs to their issues, parsing each title once.
+
+    Uses the first "[Feature #N]" tag in each title. When several issues
+    carry the same tag the first one listed wins, as with
+    find_issue_for_feature.
+
+    Args:
+        issues: Issues to index.
+
+    Returns:
+        Dictionary mapping feature ID to issue.
+    """
+    index: dict[int, GitHubIssue] = {}
+    for issue in issues:
+        match = _FEATURE_TAG_RE.search(issue.title)
+        if match:
+            index.setdefault(int(match.group(1)), issue)
+    return index
+
+
 def sync_to_github(
     features: FeaturesFile,
     config: GithubConfig,
     create_missing: bool = True,
     close_completed: bool = True,
     rate_limit_delay: float = 1.0,
+    check_auth: bool = True,
 ) -> SyncResult:
     """
     Sync features to GitHub issues.
@@ -338,6 +405,8 @@ def sync_to_github(
         create_missing: Create issues for features without them.
         close_completed: Close issues for passing features.
         rate_limit_delay: Delay between API calls to avoid rate limiting.
+        check_auth: Verify gh authentication first. Callers that have just
+            checked it can pass False to skip the extra gh invocation.
 
     Returns:
         SyncResult with details.
@@ -345,17 +414,19 @@ def sync_to_github(
     result = SyncResult(success=True)
 
     # Check authentication
-    if not check_gh_auth():
+    if check_auth and not check_gh_auth():
         result.success = False
         result.message = "GitHub CLI not authenticated. Run 'gh auth login' first."
         return result
 
-    # Get existing issues with our label
-    existing_issues = list_issues(label=config.label, state="all")
+    # Get existing issues with our label, indexed by feature ID
+    issue_feature_map = _index_issues(
+        list_issues(label=config.label, state="all", include_body=False)
+    )
 
     for feature in features.features:
         # Find existing issue
-        existing = find_issue_for_feature(feature.id, existing_issues)
+        existing = issue_feature_map.get(feature.id)
 
         if feature.passes:
             # Feature is complete
@@ -383,12 +454,8 @@ def sync_to_github(
 
             elif existing and existing.state == "closed":
                 # Reopen if it was closed
-                if reopen_issue(existing.number):
-                    add_comment(
-                        existing.number,
-                        f"Feature #{feature.id} is no longer passing. Reopening issue.",
-                    )
-                else:
+                comment = f"Feature #{feature.id} is no longer passing. Reopening issue."
+                if not reopen_issue(existing.number, comment):
                     result.errors.append(f"Failed to reopen issue #{existing.number}")
 
                 time.sleep(rate_limit_delay)
@@ -426,25 +493,15 @@ def get_sync_status(
     }
 
     # Get existing issues
-    existing_issues = list_issues(label=config.label, state="all")
-
-    # Build maps
-    feature_ids = {f.id for f in features.features}
-    issue_feature_map = {}
-
-    for issue in existing_issues:
-        # Extract feature ID from title
-        if "[Feature #" in issue.title:
-            try:
-                start = issue.title.index("[Feature #") + 10
-                end = issue.title.index("]", start)
-                feature_id = int(issue.title[start:end])
-                issue_feature_map[feature_id] = issue
-            except (ValueError, IndexError):
-                pass
+    existing_issues = list_issues(label=config.label, state="all", include_body=False)
+
+    # Build maps; feature IDs are collected during the feature pass below
+    feature_ids: set[int] = set()
+    issue_feature_map = _index_issues(existing_issues)
 
     # Check each feature
     for feature in features.features:
+        feature_ids.add(feature.id)
         issue = issue_feature_map.get(feature.id)
 
         if not issue:
@@ -474,10 +531,12 @@ def get_sync_status(
                 })
                 status["synced"] = False
 
-    # Find orphan issues
-    for feature_id, issue in issue_feature_map.items():
-        if feature_id not in feature_ids:
-            status["issues_without_features"].append(issue.number)
+    # Find orphan issues, keeping the order gh listed them in
+    status["issues_without_features"] = [
+        issue.number
+        for feature_id, issue in issue_feature_map.items()
+        if feature_id not in feature_ids
+    ]
 
     return status
 
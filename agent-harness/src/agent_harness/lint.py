@@ -3,13 +3,79 @@
 Executes linting tools and parses results.
 """
 
+import copy
+import hashlib
+import ntpath
+import os
 import re
+import shutil
 import subprocess
+import sys
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 
+# Executable names recognized by _detect_tool
+_LINT_TOOLS = frozenset({"ruff", "flake8", "pylint", "mypy"})
+
+# Diagnostics start at column 0; the (?=\S) lookahead rejects indented
+# lines (ruff's source snippets, pylint/mypy notes) before the lazy file
+# group starts scanning them.
+
+# Ruff format: file:line:col: CODE message
+_RUFF_RE = re.compile(
+    r"^(?=\S)(.+?):(\d+):(\d+):\s+([A-Z]+\d+)\s+(.+)$",
+    re.MULTILINE,
+)
+
+# Flake8 format: file:line:col: CODE message
+_FLAKE8_RE = re.compile(
+    r"^(?=\S)(.+?):(\d+):(\d+):\s+([A-Z]\d+)\s+(.+)$",
+    re.MULTILINE,
+)
+
+# Pylint format: file:line:col: CODE: msg-symbol: message
+_PYLINT_RE = re.compile(
+    r"^(?=\S)(.+?):(\d+):(\d+):\s+([CRWEF]\d+):\s+([\w-]+):\s+(.+)$",
+    re.MULTILINE,
+)
+
+# Any file:line[:col] location followed by a message
+_GENERIC_RE = re.compile(
+    r"^(.+?):(\d+):?(\d+)?:?\s+(.+)$",
+    re.MULTILINE,
+)
+
+
+# Lint results keyed by (command, source tree fingerprint), so re-linting
+# an unchanged tree skips the subprocess. Callers always receive a copy.
+_LINT_CACHE_SIZE = 32
+_lint_cache: OrderedDict[tuple[str, str], "LintResult"] = OrderedDict()
+
+# Poetry virtualenv bin directory per project directory, or None when it
+# could not be resolved, so "poetry run" startup is paid once per project.
+# Each entry carries the _poetry_env_stamp it was resolved under.
+_poetry_bin_cache: dict[str, tuple[tuple, Optional[str]]] = {}
+
+# Tools whose results are cached: all are Python linters that only read
+# _LINT_SOURCE_SUFFIXES files and _LINT_CONFIG_FILES
+_CACHEABLE_LINT_TOOLS = _LINT_TOOLS
+
+# Source files the cacheable tools check
+_LINT_SOURCE_SUFFIXES = (".py", ".pyi", ".ipynb")
+
+# Files outside the Python sources that change what linters report
+_LINT_CONFIG_FILES = frozenset({
+    "pyproject.toml", "setup.cfg", "tox.ini", ".flake8",
+    "ruff.toml", ".ruff.toml", ".pylintrc", "pylintrc", "mypy.ini", ".mypy.ini",
+})
+
+# Directories never walked when fingerprinting (hidden ones are skipped too)
+_FINGERPRINT_SKIP_DIRS = frozenset({"__pycache__", "node_modules", "venv"})
+
+
 @dataclass
 class LintIssue:
     """A single lint issue."""
@@ -52,6 +118,10 @@ def run_lint(
     """
     Run linting and return results.
 
+    Results of ruff, flake8, pylint and mypy are cached in memory per
+    command while the Python sources they check and the lint config are
+    unchanged; --fix and format commands always run.
+
     Args:
         project_dir: Path to the project directory.
         command: Lint command to run (default: "poetry run ruff check src/").
@@ -63,12 +133,116 @@ def run_lint(
     if command is None:
         command = "poetry run ruff check src/"
 
+    # Only known Python linters are cached, since only their inputs are
+    # fingerprinted; --fix and format runs change the tree and always run
+    cache_key = None
+    words = command.split()
+    if _detect_tool(command) in _CACHEABLE_LINT_TOOLS and not any(
+        word == "format" or word.startswith("--fix") for word in words
+    ):
+        cache_key = (command, _tree_fingerprint(project_dir, _lint_targets(project_dir, words)))
+        cached = _lint_cache.get(cache_key)
+        if cached is not None:
+            _lint_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
+    result = _run_lint_command(project_dir, command, timeout)
+
+    # Timeouts and missing tools are not results of the tree; retry them
+    if cache_key is not None and result.exit_code != -1:
+        _lint_cache[cache_key] = copy.deepcopy(result)
+        if len(_lint_cache) > _LINT_CACHE_SIZE:
+            _lint_cache.popitem(last=False)
+    return result
+
+
+def _lint_targets(project_dir: Path, words: list[str]) -> list[Path]:
+    """
+    Find the paths a lint command checks.
+
+    Args:
+        project_dir: Path to the project directory.
+        words: Lint command split into words.
+
+    Returns:
+        Existing paths named in the command, or the project directory when
+        the command names none.
+    """
+    targets = []
+    for word in words:
+        if word.startswith("-"):
+            continue
+        path = project_dir / word
+        if path.exists():
+            targets.append(path)
+    return targets or [project_dir]
+
+
+def _tree_fingerprint(project_dir: Path, targets: list[Path]) -> str:
+    """
+    Fingerprint the Python sources a lint run checks, plus lint config.
+
+    Hashes the path, mtime and size of every Python source under the
+    targets and every known lint config file under them or at the project
+    root, so any edit changes the fingerprint without reading file
+    contents. Hidden directories, caches and virtualenvs below a target
+    are not walked.
+
+    Args:
+        project_dir: Path to the project directory.
+        targets: Files or directories the lint command checks.
+
+    Returns:
+        Hex digest of the tree state.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    entries = []
+
+    def add(path: str) -> None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        entries.append((path, stat.st_mtime_ns, stat.st_size))
+
+    for name in _LINT_CONFIG_FILES:
+        add(os.path.join(project_dir, name))
+
+    pending = []
+    for target in targets:
+        if target.is_dir():
+            pending.append(str(target))
+        else:
+            add(str(target))
+
+    while pending:
+        try:
+            scan = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with scan:
+            for entry in scan:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith(".") and name not in _FINGERPRINT_SKIP_DIRS:
+                        pending.append(entry.path)
+                elif name.endswith(_LINT_SOURCE_SUFFIXES) or name in _LINT_CONFIG_FILES:
+                    add(entry.path)
+
+    # Sorted so the digest does not depend on directory listing order
+    for path, mtime_ns, size in sorted(set(entries)):
+        digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode())
+    return digest.hexdigest()
+
+
+def _run_lint_command(project_dir: Path, command: str, timeout: int) -> LintResult:
+    """Run a lint command and parse its output."""
     # Parse command into parts
     cmd_parts = command.split()
 
     try:
         result = subprocess.run(
-            cmd_parts,
+            _resolve_poetry_run(project_dir, cmd_parts),
             cwd=project_dir,
             capture_output=True,
             text=True,
@@ -100,20 +274,133 @@ def run_lint(
         return _parse_generic_output(raw_output, exit_code, tool)
 
 
-def _detect_tool(command: str) -> str:
-    """Detect which lint tool is being used."""
-    command_lower = command.lower()
-
-    if "ruff" in command_lower:
-        return "ruff"
-    elif "flake8" in command_lower:
-        return "flake8"
-    elif "pylint" in command_lower:
-        return "pylint"
-    elif "mypy" in command_lower:
-        return "mypy"
+def _poetry_envs_file() -> Path:
+    """Get the file where Poetry records which virtualenv each project uses."""
+    cache_dir = os.environ.get("POETRY_CACHE_DIR")
+    if cache_dir:
+        base = Path(cache_dir)
+    elif sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", "~")).expanduser() / "pypoetry" / "Cache"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches" / "pypoetry"
     else:
-        return "unknown"
+        base = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "pypoetry"
+    return base / "virtualenvs" / "envs.toml"
+
+
+def _poetry_env_stamp(project_dir: Path) -> tuple:
+    """
+    Stat the files that decide which virtualenv Poetry uses for a project.
+
+    Editing pyproject.toml or poetry.lock, or switching environments with
+    "poetry env use" (which rewrites envs.toml), changes the stamp.
+
+    Args:
+        project_dir: Path to the project directory.
+
+    Returns:
+        (mtime, size) per file, or None for a file that does not exist.
+    """
+    stamp = []
+    for path in (
+        project_dir / "pyproject.toml",
+        project_dir / "poetry.lock",
+        _poetry_envs_file(),
+    ):
+        try:
+            st = path.stat()
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def _poetry_bin_dir(project_dir: Path) -> Optional[str]:
+    """
+    Find the bin directory of a project's Poetry virtualenv.
+
+    The answer is reused until the project's Poetry files or environment
+    selection change, or the cached directory disappears.
+
+    Args:
+        project_dir: Path to the project directory.
+
+    Returns:
+        Path to the virtualenv's executables, or None if Poetry is missing
+        or the project has no environment.
+    """
+    key = str(project_dir.resolve())
+    stamp = _poetry_env_stamp(project_dir)
+    cached = _poetry_bin_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        bin_dir = cached[1]
+        if bin_dir is None or os.path.isdir(bin_dir):
+            return bin_dir
+
+    bin_dir = None
+    try:
+        result = subprocess.run(
+            ["poetry", "env", "info", "--path"],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        env_path = result.stdout.strip()
+        if result.returncode == 0 and env_path:
+            candidate = Path(env_path) / ("Scripts" if os.name == "nt" else "bin")
+            if candidate.is_dir():
+                bin_dir = str(candidate)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        pass
+
+    _poetry_bin_cache[key] = (stamp, bin_dir)
+    return bin_dir
+
+
+def _resolve_poetry_run(project_dir: Path, cmd_parts: list[str]) -> list[str]:
+    """
+    Replace a "poetry run <tool>" prefix with the tool's virtualenv path.
+
+    Each "poetry run" starts a Python interpreter and loads Poetry before
+    the linter itself starts, which costs more than the lint run on small
+    trees. Calling the virtualenv's executable directly runs the same
+    binary without that startup.
+
+    Args:
+        project_dir: Path to the project directory.
+        cmd_parts: Command split into words.
+
+    Returns:
+        The command to execute; unchanged unless the tool was found.
+    """
+    if len(cmd_parts) < 3 or cmd_parts[:2] != ["poetry", "run"]:
+        return cmd_parts
+
+    bin_dir = _poetry_bin_dir(project_dir)
+    if bin_dir is None:
+        return cmd_parts
+
+    executable = shutil.which(cmd_parts[2], path=bin_dir)
+    if executable is None:
+        return cmd_parts
+    return [executable, *cmd_parts[3:]]
+
+
+def _detect_tool(command: str) -> str:
+    """Detect which lint tool is being used.
+
+    Returns the first word of the command that names a known tool, so
+    runner prefixes ("poetry run", "python -m", a path to the binary) need
+    no special handling. Windows paths and ".exe" names are recognized too.
+    """
+    for word in command.lower().split():
+        # ntpath splits on both "/" and "\\"
+        name = ntpath.basename(word).removesuffix(".exe")
+        if name in _LINT_TOOLS:
+            return name
+    return "unknown"
 
 
 def _parse_ruff_output(output: str, exit_code: int) -> LintResult:
@@ -122,13 +409,7 @@ def _parse_ruff_output(output: str, exit_code: int) -> LintResult:
     errors = 0
     warnings = 0
 
-    # Ruff format: file:line:col: CODE message
-    pattern = re.compile(
-        r"^(.+?):(\d+):(\d+):\s+([A-Z]+\d+)\s+(.+)$",
-        re.MULTILINE,
-    )
-
-    for match in pattern.finditer(output):
+    for match in _RUFF_RE.finditer(output):
         file_path = match.group(1)
         line = int(match.group(2))
         column = int(match.group(3))
@@ -169,13 +450,7 @@ def _parse_flake8_output(output: str, exit_code: int) -> LintResult:
     errors = 0
     warnings = 0
 
-    # Flake8 format: file:line:col: CODE message
-    pattern = re.compile(
-        r"^(.+?):(\d+):(\d+):\s+([A-Z]\d+)\s+(.+)$",
-        re.MULTILINE,
-    )
-
-    for match in pattern.finditer(output):
+    for match in _FLAKE8_RE.finditer(output):
         file_path = match.group(1)
         line = int(match.group(2))
         column = int(match.group(3))
@@ -213,13 +488,7 @@ def _parse_pylint_output(output: str, exit_code: int) -> LintResult:
     errors = 0
     warnings = 0
 
-    # Pylint format: file:line:col: CODE: msg-symbol: message
-    pattern = re.compile(
-        r"^(.+?):(\d+):(\d+):\s+([CRWEF]\d+):\s+([\w-]+):\s+(.+)$",
-        re.MULTILINE,
-    )
-
-    for match in pattern.finditer(output):
+    for match in _PYLINT_RE.finditer(output):
         file_path = match.group(1)
         line = int(match.group(2))
         column = int(match.group(3))
@@ -262,12 +531,7 @@ def _parse_generic_output(
     issues = []
     errors = 0
 
-    pattern = re.compile(
-        r"^(.+?):(\d+):?(\d+)?:?\s+(.+)$",
-        re.MULTILINE,
-    )
-
-    for match in pattern.finditer(output):
+    for match in _GENERIC_RE.finditer(output):
         file_path = match.group(1)
         line = int(match.group(2))
         column = int(match.group(3)) if match.group(3) else 0
@@ -391,8 +655,4 @@ def get_error_codes_summary(result: LintResult) -> dict[str, int]:
     Returns:
         Dictionary mapping codes to counts.
     """
-    counts: dict[str, int] = {}
-    for issue in result.issues:
-        code = issue.code or "unknown"
-        counts[code] = counts.get(code, 0) + 1
-    return counts
+    return dict(Counter(issue.code or "unknown" for issue in result.issues))
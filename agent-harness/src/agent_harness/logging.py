@@ -4,11 +4,19 @@ Logs events to structured JSONL files in .harness/logs/.
 """
 
 import json
-from dataclasses import dataclass, asdict
+import os
+import weakref
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional, Iterator
+from typing import Any, BinaryIO, Optional, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is the fallback
+    orjson = None
 
 
 class LogLevel(Enum):
@@ -26,10 +34,35 @@ LOG_LEVEL_ORDER = {
     LogLevel.CRITICAL: 3,
 }
 
+# LOG_LEVEL_ORDER keyed by the level strings stored in LogEvent.level
+_LEVEL_ORDER_BY_VALUE = {level.value: order for level, order in LOG_LEVEL_ORDER.items()}
+
+
+def _dumps_line(obj: dict) -> bytes:
+    """Serialize obj as one UTF-8 JSONL line, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; let json handle or reject it
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+# Block size used when reading log files backwards from the end
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Both accept bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_loads = orjson.loads if orjson is not None else json.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class LogEvent:
-    """A logged event."""
+    """A logged event.
+
+    Slotted because log reads create one instance per line.
+    """
 
     timestamp: str
     event_type: str
@@ -50,30 +83,83 @@ class LogEvent:
     @classmethod
     def from_dict(cls, data: dict) -> "LogEvent":
         """Create from dictionary."""
+        get = data.get
+        # Positional arguments in field order
         return cls(
-            timestamp=data.get("timestamp", ""),
-            event_type=data.get("event_type", ""),
-            level=data.get("level", "routine"),
-            session_id=data.get("session_id"),
-            data=data.get("data", {}),
+            get("timestamp", ""),
+            get("event_type", ""),
+            get("level", "routine"),
+            get("session_id"),
+            get("data", {}),
         )
 
 
+def _close_files(handles: dict[str, BinaryIO], index_fds: dict[str, int]) -> None:
+    """Flush and close a logger's log file handles and index descriptors."""
+    for handle in handles.values():
+        handle.close()
+    handles.clear()
+    for fd in index_fds.values():
+        os.close(fd)
+    index_fds.clear()
+
+
 class EventLogger:
-    """Logger for harness events."""
+    """Logger for harness events.
+
+    Log files are opened on first use and kept open until close(), or
+    until the logger is garbage collected. The logger can be used as a
+    context manager to close them automatically.
+    Unbuffered loggers keep a .idx sidecar per log file recording where
+    each session's events start, which query_logs uses to read only the
+    requested session.
+    """
 
-    def __init__(self, logs_dir: Path, session_id: Optional[int] = None):
+    def __init__(
+        self,
+        logs_dir: Path,
+        session_id: Optional[int] = None,
+        buffered: bool = False,
+    ):
         """
         Initialize the event logger.
 
         Args:
             logs_dir: Path to .harness/logs/ directory.
             session_id: Current session ID (optional).
+            buffered: Hold writes in memory until flush() or close() instead
+                of flushing each event to disk as it is logged. Buffered
+                loggers do not update the session index, since offsets are
+                only known once a write reaches the file.
         """
         self.logs_dir = logs_dir
         self.session_id = session_id
+        self.buffered = buffered
+        self._handles: dict[str, BinaryIO] = {}
+        # log_type -> (session_id, end offset) of this logger's last write
+        self._index_state: dict[str, tuple[Optional[int], int]] = {}
+        # log_type -> file descriptor of the open .idx sidecar
+        self._index_fds: dict[str, int] = {}
+        # Release files of loggers that are dropped without close(); the
+        # finalizer holds the dicts, not the logger, so it can still run
+        weakref.finalize(self, _close_files, self._handles, self._index_fds)
         self._ensure_logs_dir()
 
+    def __enter__(self) -> "EventLogger":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """Write any buffered events to disk."""
+        for handle in self._handles.values():
+            handle.flush()
+
+    def close(self) -> None:
+        """Flush and close all open log files."""
+        _close_files(self._handles, self._index_fds)
+
     def _ensure_logs_dir(self) -> None:
         """Ensure logs directory exists."""
         self.logs_dir.mkdir(parents=True, exist_ok=True)
@@ -82,11 +168,85 @@ class EventLogger:
         """Get the path to a log file."""
         return self.logs_dir / f"{log_type}.jsonl"
 
-    def _write_event(self, log_type: str, event: LogEvent) -> None:
-        """Write an event to a log file."""
-        log_file = self._get_log_file(log_type)
-        with open(log_file, "a") as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
+    def _get_handle(self, log_type: str) -> BinaryIO:
+        """Get the open append handle for a log file, opening it if needed."""
+        handle = self._handles.get(log_type)
+        if handle is None:
+            handle = open(self._get_log_file(log_type), "ab")
+            self._handles[log_type] = handle
+        return handle
+
+    def _write_event(self, event: LogEvent, *log_types: str) -> None:
+        """Append an event to one or more log files, serializing it once."""
+        line = _dumps_line(event.to_dict())
+        for log_type in log_types:
+            handle = self._get_handle(log_type)
+            handle.write(line)
+            if not self.buffered:
+                handle.flush()
+                # After the flush tell() is the real end of the file
+                self._update_index(log_type, event.session_id, handle.tell(), len(line))
+
+    def _get_index_fd(self, log_type: str) -> int:
+        """Get the open .idx sidecar for a log file, creating it if needed."""
+        fd = self._index_fds.get(log_type)
+        if fd is None:
+            index_file = _get_index_file(self._get_log_file(log_type))
+            fd = os.open(index_file, os.O_RDWR | os.O_CREAT, 0o644)
+            if os.fstat(fd).st_size == 0:
+                os.pwrite(fd, _index_header(0), 0)
+            self._index_fds[log_type] = fd
+        return fd
+
+    def _update_index(
+        self,
+        log_type: str,
+        session_id: Optional[int],
+        end: int,
+        size: int,
+    ) -> None:
+        """
+        Record a flushed event in the log file's session index.
+
+        An entry is appended whenever the session changes or the write does
+        not follow on from this logger's previous one. In the latter case
+        any bytes between the end the index covers and this write came from
+        another writer and are marked as unknown, so every session query
+        reads them. The header is then moved to cover this write.
+
+        Args:
+            log_type: Log file the event was written to.
+            session_id: Session ID of the event.
+            end: Real file offset just after the event.
+            size: Length of the event line in bytes.
+        """
+        start = end - size
+        state = self._index_state.get(log_type)
+        entries = []
+        if state is None or state[1] != start:
+            # Reopen in case the sidecar was replaced, e.g. by cleanup_old_logs
+            fd = self._index_fds.pop(log_type, None)
+            if fd is not None:
+                os.close(fd)
+            fd = self._get_index_fd(log_type)
+            covered = _read_index_covered(fd)
+            if covered is None or covered > start:
+                covered = 0
+            if covered < start:
+                entries.append({"offset": covered, "unknown": True})
+            entries.append({"session_id": session_id, "offset": start})
+        else:
+            fd = self._get_index_fd(log_type)
+            if state[0] != session_id:
+                entries.append({"session_id": session_id, "offset": start})
+
+        # Entries first, then the header, so the header never claims
+        # coverage of bytes without an entry
+        if entries:
+            os.lseek(fd, 0, os.SEEK_END)
+            os.write(fd, b"".join(_dumps_line(entry) for entry in entries))
+        os.pwrite(fd, _index_header(end), 0)
+        self._index_state[log_type] = (session_id, end)
 
     def _create_event(
         self,
@@ -122,7 +282,7 @@ class EventLogger:
             level: Log level.
         """
         event = self._create_event(event_type, data, level)
-        self._write_event("events", event)
+        self._write_event(event, "events")
 
     def log_decision(
         self,
@@ -143,8 +303,7 @@ class EventLogger:
             "context": context or {},
         }
         event = self._create_event("decision", data, level)
-        self._write_event("decisions", event)
-        self._write_event("events", event)
+        self._write_event(event, "decisions", "events")
 
     def log_agent_action(
         self,
@@ -165,8 +324,7 @@ class EventLogger:
             **data,
         }
         event = self._create_event("agent_action", action_data, level)
-        self._write_event("agent_actions", event)
-        self._write_event("events", event)
+        self._write_event(event, "agent_actions", "events")
 
     def log_error(
         self,
@@ -187,8 +345,7 @@ class EventLogger:
             "details": details or {},
         }
         event = self._create_event("error", data, level)
-        self._write_event("errors", event)
-        self._write_event("events", event)
+        self._write_event(event, "errors", "events")
 
     def log_verification(
         self,
@@ -212,8 +369,7 @@ class EventLogger:
             "details": details or {},
         }
         event = self._create_event("verification", data, level)
-        self._write_event("verifications", event)
-        self._write_event("events", event)
+        self._write_event(event, "verifications", "events")
 
     def log_session_start(
         self,
@@ -261,6 +417,203 @@ class EventLogger:
         self.log_event("session_end", data, LogLevel.IMPORTANT)
 
 
+def _get_index_file(log_file: Path) -> Path:
+    """Get the session index sidecar for a log file."""
+    # Not *.jsonl, so cleanup_old_logs never treats it as a log
+    return log_file.with_suffix(".idx")
+
+
+# The .idx sidecar starts with a fixed-width JSON header line recording how
+# many bytes of the log it covers, rewritten in place after every indexed
+# write. The remaining lines are entries: {"session_id", "offset"} where a
+# run of one session's events starts, or {"offset", "unknown": true} where
+# bytes from an unindexed writer start.
+_INDEX_HEADER_SIZE = 32
+
+
+def _index_header(covered: int) -> bytes:
+    """Build the fixed-width header line for an index covering covered bytes."""
+    return f'{{"covered": {covered}}}'.encode().ljust(_INDEX_HEADER_SIZE - 1) + b"\n"
+
+
+def _parse_index_header(header: bytes) -> Optional[int]:
+    """Read the covered byte count from an index header, or None if invalid."""
+    try:
+        covered = _loads(header)["covered"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+    return covered if isinstance(covered, int) else None
+
+
+def _read_index_covered(fd: int) -> Optional[int]:
+    """Read the covered byte count from an open index file."""
+    return _parse_index_header(os.pread(fd, _INDEX_HEADER_SIZE, 0))
+
+
+# Parsed session indexes keyed by .idx path, with the index file's
+# (inode, mtime, size, covered bytes) when parsed. Each value is (covered
+# bytes, merged byte ranges per session ID, ranges of unknown session), or
+# None if unusable.
+_SessionIndex = tuple[
+    int,
+    dict[Optional[int], list[tuple[int, int]]],
+    list[tuple[int, int]],
+]
+_session_index_cache: dict[
+    str, tuple[tuple[int, int, int, Optional[int]], Optional[_SessionIndex]]
+] = {}
+
+
+def _parse_session_index(raw: bytes) -> Optional[_SessionIndex]:
+    """
+    Parse the contents of an index file.
+
+    Args:
+        raw: Contents of the .idx file.
+
+    Returns:
+        (covered bytes, ranges by session, unknown ranges), or None if the
+        index is malformed or its entries are out of order.
+    """
+    covered = _parse_index_header(raw[:_INDEX_HEADER_SIZE])
+    if covered is None:
+        return None
+
+    entries = []
+    try:
+        for line in raw[_INDEX_HEADER_SIZE:].splitlines():
+            if line.strip():
+                data = _loads(line)
+                session_id = None if data.get("unknown") else data["session_id"]
+                entries.append((bool(data.get("unknown")), session_id, data["offset"]))
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        return None
+
+    offsets = [offset for _, _, offset in entries]
+    if offsets != sorted(offsets) or any(not 0 <= offset <= covered for offset in offsets):
+        return None
+
+    by_session: dict[Optional[int], list[tuple[int, int]]] = {}
+    unknown: list[tuple[int, int]] = []
+    # Bytes before the first entry were not written through the index
+    if offsets and offsets[0] > 0:
+        unknown.append((0, offsets[0]))
+    elif not offsets and covered > 0:
+        return None
+    ends = offsets[1:] + [covered]
+    for (is_unknown, session_id, start), end in zip(entries, ends):
+        if start == end:
+            continue
+        ranges = unknown if is_unknown else by_session.setdefault(session_id, [])
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return covered, by_session, unknown
+
+
+def _load_session_index(log_file: Path) -> Optional[_SessionIndex]:
+    """
+    Load a log file's session index, grouped by session ID.
+
+    The parsed index is cached as a hint. Every call re-reads the index
+    header, since the logger rewrites it in place without necessarily
+    changing the file's size or mtime, and reparses when either the stat or
+    the covered byte count differs from the cached copy. Callers must still
+    check the covered count against the log's current size.
+
+    Args:
+        log_file: Path to the log file.
+
+    Returns:
+        (covered bytes, ranges by session, unknown ranges), or None if the
+        index is missing or malformed.
+    """
+    index_file = _get_index_file(log_file)
+    try:
+        with open(index_file, "rb") as f:
+            st = os.fstat(f.fileno())
+            covered = _parse_index_header(f.read(_INDEX_HEADER_SIZE))
+            stamp = (st.st_ino, st.st_mtime_ns, st.st_size, covered)
+            cached = _session_index_cache.get(str(index_file))
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            f.seek(0)
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+
+    index = _parse_session_index(raw)
+    _session_index_cache[str(index_file)] = (stamp, index)
+    return index
+
+
+def _session_ranges(
+    log_file: Path,
+    session_id: Optional[int],
+) -> Optional[list[tuple[int, Optional[int]]]]:
+    """
+    Find the byte ranges of a log file that can hold a session's events.
+
+    Ranges written by unknown writers are always included. The index is
+    only used when it covers exactly the current log; anything appended
+    without updating it (another tool, a buffered logger, a crash between
+    the two writes) makes the caller fall back to a full scan.
+
+    Args:
+        log_file: Path to the log file.
+        session_id: Session ID to look up.
+
+    Returns:
+        Sorted list of (start, end) offsets, or None if the index is
+        missing or does not match the file.
+    """
+    index = _load_session_index(log_file)
+    if index is None:
+        return None
+    covered, by_session, unknown = index
+    if covered != log_file.stat().st_size:
+        return None
+
+    ranges: list[tuple[int, Optional[int]]] = []
+    for start, end in sorted(by_session.get(session_id, []) + unknown):
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def _read_ranges(
+    log_file: Path,
+    ranges: list[tuple[int, Optional[int]]],
+) -> list[LogEvent]:
+    """
+    Read events from byte ranges of a log file.
+
+    Args:
+        log_file: Path to the log file.
+        ranges: (start, end) offsets at line boundaries; end None means
+            end of file.
+
+    Returns:
+        List of LogEvent objects in file order.
+    """
+    events = []
+    with open(log_file, "rb") as f:
+        for start, end in ranges:
+            f.seek(start)
+            chunk = f.read() if end is None else f.read(end - start)
+            for line in chunk.splitlines():
+                line = line.strip()
+                if line:
+                    try:
+                        events.append(LogEvent.from_dict(_loads(line)))
+                    except json.JSONDecodeError:
+                        continue
+    return events
+
+
 def read_log_file(
     log_file: Path,
     limit: Optional[int] = None,
@@ -281,17 +634,16 @@ def read_log_file(
         return []
 
     events = []
-    with open(log_file) as f:
-        for i, line in enumerate(f):
-            if i < offset:
-                continue
+    with open(log_file, "rb") as f:
+        # Skipped lines are consumed by islice without being stripped or parsed
+        for line in islice(f, offset, None):
             if limit and len(events) >= limit:
                 break
 
             line = line.strip()
             if line:
                 try:
-                    data = json.loads(line)
+                    data = _loads(line)
                     events.append(LogEvent.from_dict(data))
                 except json.JSONDecodeError:
                     continue
@@ -299,6 +651,91 @@ def read_log_file(
     return events
 
 
+def _iter_lines_reversed(
+    log_file: Path,
+    block_size: int = _TAIL_BLOCK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Yield the non-blank lines of a file, last line first.
+
+    The file is read backwards in blocks, so finding recent events costs
+    roughly one block rather than a read of the whole file.
+
+    Args:
+        log_file: Path to the log file.
+        block_size: Bytes to read per seek.
+
+    Yields:
+        Stripped raw lines, newest first.
+    """
+    with open(log_file, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        partial = b""
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            lines = (f.read(end - start) + partial).split(b"\n")
+            end = start
+            # The first piece may continue in the previous block
+            partial = lines.pop(0)
+            for line in reversed(lines):
+                line = line.strip()
+                if line:
+                    yield line
+        partial = partial.strip()
+        if partial:
+            yield partial
+
+
+def _tail_start(f: BinaryIO, n: int, block_size: int = _TAIL_BLOCK_SIZE) -> int:
+    """
+    Find where the last n lines of an open file begin.
+
+    Args:
+        f: File opened in binary mode.
+        n: Number of lines to keep.
+        block_size: Bytes to read per seek.
+
+    Returns:
+        Byte offset of the first kept line, or 0 if the file has at most
+        n lines.
+    """
+    end = f.seek(0, os.SEEK_END)
+    if not end:
+        return 0
+    # The newline ending the last line does not start another one
+    f.seek(end - 1)
+    needed = n + (f.read(1) == b"\n")
+
+    pos = end
+    while pos > 0:
+        start = max(0, pos - block_size)
+        f.seek(start)
+        block = f.read(pos - start)
+        count = block.count(b"\n")
+        if count >= needed:
+            index = len(block)
+            for _ in range(needed):
+                index = block.rindex(b"\n", 0, index)
+            return start + index + 1
+        needed -= count
+        pos = start
+    return 0
+
+
+def _count_lines(f: BinaryIO, stop: int, block_size: int = _TAIL_BLOCK_SIZE) -> int:
+    """Count the newline-terminated lines in the first stop bytes of f."""
+    f.seek(0)
+    count = 0
+    while stop > 0:
+        block = f.read(min(block_size, stop))
+        if not block:
+            break
+        count += block.count(b"\n")
+        stop -= len(block)
+    return count
+
+
 def query_logs(
     logs_dir: Path,
     log_type: str = "events",
@@ -327,22 +764,22 @@ def query_logs(
     if not log_file.exists():
         return []
 
-    # Read all events
-    events = read_log_file(log_file)
+    # Read only the parts of the file the session index points at, when
+    # there is a usable index; otherwise read all events
+    ranges = _session_ranges(log_file, session_id) if session_id is not None else None
+    if ranges is not None:
+        events = _read_ranges(log_file, ranges)
+    else:
+        events = read_log_file(log_file)
 
-    # Filter by level
+    # Filter by level and session in one pass; unknown levels rank as routine
     min_level_order = LOG_LEVEL_ORDER.get(min_level, 1)
-    filtered = []
-    for event in events:
-        event_level = LogLevel(event.level) if event.level in [l.value for l in LogLevel] else LogLevel.ROUTINE
-        if LOG_LEVEL_ORDER.get(event_level, 1) >= min_level_order:
-            filtered.append(event)
-
-    events = filtered
-
-    # Filter by session
-    if session_id is not None:
-        events = [e for e in events if e.session_id == session_id]
+    level_order = _LEVEL_ORDER_BY_VALUE.get
+    events = [
+        event for event in events
+        if level_order(event.level, 1) >= min_level_order
+        and (session_id is None or event.session_id == session_id)
+    ]
 
     # Filter by query
     if query:
@@ -414,10 +851,24 @@ def get_last_session_id(logs_dir: Path) -> Optional[int]:
     Returns:
         Last session ID, or None if no sessions.
     """
-    events = query_logs(logs_dir, "events", limit=100)
-    for event in events:
+    log_file = logs_dir / "events.jsonl"
+    if not log_file.exists():
+        return None
+
+    # Same window as query_logs(limit=100): the newest 100 non-debug events
+    checked = 0
+    for line in _iter_lines_reversed(log_file):
+        try:
+            event = LogEvent.from_dict(_loads(line))
+        except json.JSONDecodeError:
+            continue
+        if event.level == LogLevel.DEBUG.value:
+            continue
         if event.session_id is not None:
             return event.session_id
+        checked += 1
+        if checked >= 100:
+            break
     return None
 
 
@@ -471,16 +922,20 @@ def cleanup_old_logs(
     for log_file in logs_dir.glob("*.jsonl"):
         size_mb = log_file.stat().st_size / (1024 * 1024)
         if size_mb > max_size_mb / 4:  # Per-file limit is 1/4 of total
-            # Read all events
-            events = read_log_file(log_file)
-            if len(events) > 1000:
-                # Keep only the last 1000 events
-                lines_removed += len(events) - 1000
-                events = events[-1000:]
-
-                # Rewrite file
-                with open(log_file, "w") as f:
-                    for event in events:
-                        f.write(json.dumps(event.to_dict()) + "\n")
+            # Keep only the last 1000 lines, moving bytes without parsing.
+            # The file is rewritten in place rather than replaced so open
+            # EventLogger handles keep appending to it.
+            with open(log_file, "r+b") as f:
+                start = _tail_start(f, 1000)
+                if not start:
+                    continue
+                lines_removed += _count_lines(f, start)
+                f.seek(start)
+                tail = f.read()
+                f.seek(0)
+                f.write(tail)
+                f.truncate()
+            # Offsets no longer match; queries scan until writers re-index
+            _get_index_file(log_file).unlink(missing_ok=True)
 
     return lines_removed
@@ -1,10 +1,36 @@
 """Pytest configuration and fixtures for agent-harness tests."""
 
+import os
 import pytest
 from pathlib import Path
 import tempfile
 import shutil
 
+from git import Repo
+
+
+def pytest_configure(config):
+    """Place pytest's temp directories on tmpfs when ONBELAY_TESTS_TMPFS=1.
+
+    Only applies on systems with /dev/shm and when --basetemp is not given.
+    Each run gets its own directory, so concurrent runs do not wipe each
+    other's temp trees, and it is removed when the run ends.
+    """
+    if os.environ.get("ONBELAY_TESTS_TMPFS") != "1" or config.option.basetemp:
+        return
+
+    if Path("/dev/shm").is_dir():
+        run_dir = tempfile.mkdtemp(dir="/dev/shm", prefix="onbelay-tests-")
+        config._onbelay_tmpfs_dir = run_dir
+        config.option.basetemp = run_dir
+
+
+def pytest_unconfigure(config):
+    """Remove the tmpfs directory created by pytest_configure, if any."""
+    run_dir = getattr(config, "_onbelay_tmpfs_dir", None)
+    if run_dir is not None:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
 
 @pytest.fixture
 def temp_project_dir():
@@ -14,6 +40,49 @@ def temp_project_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(scope="session")
+def default_config():
+    """Return a default Config shared across the test session.
+
+    Treat it as read-only; tests that modify a config should call
+    get_default_config() for their own copy.
+    """
+    from agent_harness.config import get_default_config
+
+    return get_default_config()
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory):
+    """Build a repository with one commit, once per test session."""
+    path = tmp_path_factory.mktemp("git-template")
+    repo = Repo.init(path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test User")
+        config.set_value("user", "email", "test@example.com")
+
+    # Create initial commit
+    test_file = path / "initial.txt"
+    test_file.write_text("initial content")
+    repo.index.add(["initial.txt"])
+    repo.index.commit("Initial commit")
+
+    return path
+
+
+@pytest.fixture
+def git_repo(tmp_path, git_template):
+    """Create a temporary git repository as a copy of the session template."""
+    shutil.copytree(git_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
+@pytest.fixture
+def git_repo_obj(git_repo):
+    """Return an open Repo for the git_repo fixture's directory."""
+    return Repo(git_repo)
+
+
 @pytest.fixture
 def sample_harness_yaml():
     """Return a sample .harness.yaml configuration."""
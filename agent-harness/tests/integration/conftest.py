@@ -25,18 +25,9 @@ def integration_project(tmp_path):
     """
     # Create git repository
     subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=tmp_path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=tmp_path,
-        capture_output=True,
-        check=True,
-    )
+    # Append the identity directly rather than running `git config` twice
+    with open(tmp_path / ".git" / "config", "a") as git_config:
+        git_config.write("[user]\n\temail = test@example.com\n\tname = Test User\n")
 
     # Create .harness directory structure
     harness_dir = tmp_path / ".harness"
@@ -1,6 +1,8 @@
 """Tests for checkpoint.py - Checkpoint system."""
 
 import json
+import shutil
+
 import pytest
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
@@ -24,46 +26,53 @@ from agent_harness.checkpoint import (
 from agent_harness.exceptions import StateError
 
 
+# Harness files written into every project fixture, relative to the project root.
+# Tests overwrite these in place (and rollback copies over them), so each test
+# gets its own copies rather than links to a shared template.
+PROJECT_FILES = {
+    "features.json": '{"project": "test", "features": []}',
+    "claude-progress.txt": "# Claude Progress Log\n",
+    ".harness/session_state.json": '{"session": 1, "status": "complete"}',
+}
+
+
 @pytest.fixture
 def project_with_files(tmp_path):
     """Create a project directory with harness files."""
-    # Create .harness directory
-    harness_dir = tmp_path / ".harness"
-    harness_dir.mkdir()
-
-    # Create features.json
-    features_path = tmp_path / "features.json"
-    features_path.write_text('{"project": "test", "features": []}')
-
-    # Create claude-progress.txt
-    progress_path = tmp_path / "claude-progress.txt"
-    progress_path.write_text("# Claude Progress Log\n")
-
-    # Create session state
-    state_path = harness_dir / "session_state.json"
-    state_path.write_text('{"session": 1, "status": "complete"}')
+    (tmp_path / ".harness").mkdir()
+    for relative_path, content in PROJECT_FILES.items():
+        (tmp_path / relative_path).write_text(content)
 
     return tmp_path
 
 
-@pytest.fixture
-def git_project(tmp_path):
-    """Create a project with git repository."""
-    repo = Repo.init(tmp_path)
-    repo.config_writer().set_value("user", "name", "Test User").release()
-    repo.config_writer().set_value("user", "email", "test@example.com").release()
+@pytest.fixture(scope="module")
+def git_project_template(tmp_path_factory):
+    """Build the git project once; tests work on copies of it."""
+    path = tmp_path_factory.mktemp("git-project")
+    repo = Repo.init(path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test User")
+        config.set_value("user", "email", "test@example.com")
 
     # Create initial files
-    harness_dir = tmp_path / ".harness"
+    harness_dir = path / ".harness"
     harness_dir.mkdir()
 
-    features_path = tmp_path / "features.json"
-    features_path.write_text('{"project": "test", "features": []}')
+    features_path = path / "features.json"
+    features_path.write_text(PROJECT_FILES["features.json"])
 
     # Initial commit
     repo.index.add(["features.json"])
     repo.index.commit("Initial commit")
 
+    return path
+
+
+@pytest.fixture
+def git_project(tmp_path, git_project_template):
+    """Create a project with git repository."""
+    shutil.copytree(git_project_template, tmp_path, dirs_exist_ok=True)
     return tmp_path
 
 
@@ -99,6 +108,23 @@ class TestCreateCheckpoint:
         assert (checkpoint_path / "claude-progress.txt").exists()
         assert (checkpoint_path / "checkpoint.json").exists()
 
+    def test_create_checkpoint_leaves_no_temp_files(self, project_with_files):
+        """Test that metadata is written without leaving temp files behind."""
+        checkpoint = create_checkpoint(project_with_files, session=1, reason="Test")
+
+        checkpoint_path = project_with_files / ".harness" / "checkpoints" / checkpoint.id
+        assert not list(checkpoint_path.glob("*.tmp"))
+        data = json.loads((checkpoint_path / "checkpoint.json").read_text())
+        assert data["id"] == checkpoint.id
+
+    def test_create_checkpoint_timestamp_format(self, project_with_files):
+        """Test that the checkpoint timestamp is ISO 8601 UTC with a Z suffix."""
+        checkpoint = create_checkpoint(project_with_files, session=1, reason="Test")
+
+        assert checkpoint.timestamp.endswith("Z")
+        parsed = datetime.fromisoformat(checkpoint.timestamp)
+        assert parsed.tzinfo == timezone.utc
+
     def test_create_checkpoint_with_git(self, git_project):
         """Test that checkpoint captures git ref."""
         checkpoint = create_checkpoint(
@@ -110,6 +136,12 @@ class TestCreateCheckpoint:
         assert checkpoint.git_ref
         assert len(checkpoint.git_ref) == 40  # Full SHA
 
+    def test_create_checkpoint_without_git(self, project_with_files):
+        """Test that a checkpoint outside a git repository has no git ref."""
+        checkpoint = create_checkpoint(project_with_files, session=1, reason="Test")
+
+        assert checkpoint.git_ref == ""
+
     def test_create_checkpoint_computes_hashes(self, project_with_files):
         """Test that checkpoint computes file hashes."""
         checkpoint = create_checkpoint(
@@ -123,6 +155,47 @@ class TestCreateCheckpoint:
         assert checkpoint.session_state_hash
 
 
+class TestBackupStorage:
+    """Tests for shared backup storage across checkpoints."""
+
+    def test_identical_backups_share_storage(self, project_with_files):
+        """Test that unchanged files are stored once across checkpoints."""
+        first = create_checkpoint(project_with_files, session=1, reason="First")
+        second = create_checkpoint(project_with_files, session=2, reason="Second")
+
+        checkpoints_dir = project_with_files / ".harness" / "checkpoints"
+        first_backup = checkpoints_dir / first.id / "features.json"
+        second_backup = checkpoints_dir / second.id / "features.json"
+
+        assert first_backup.stat().st_ino == second_backup.stat().st_ino
+        assert first_backup.read_text() == PROJECT_FILES["features.json"]
+
+    def test_delete_last_checkpoint_removes_blobs(self, project_with_files):
+        """Test that blobs are removed once no checkpoint references them."""
+        first = create_checkpoint(project_with_files, session=1, reason="First")
+        second = create_checkpoint(project_with_files, session=2, reason="Second")
+        blob_dir = project_with_files / ".harness" / "checkpoints" / "_blobs"
+
+        delete_checkpoint(project_with_files, first.id)
+        assert (blob_dir / second.features_json_hash).exists()
+
+        delete_checkpoint(project_with_files, second.id)
+        assert list(blob_dir.iterdir()) == []
+
+    def test_rollback_does_not_modify_shared_backup(self, project_with_files):
+        """Test that editing restored files leaves other checkpoints intact."""
+        first = create_checkpoint(project_with_files, session=1, reason="First")
+        second = create_checkpoint(project_with_files, session=2, reason="Second")
+
+        rollback_to_checkpoint(project_with_files, first.id, restore_git=False)
+        (project_with_files / "features.json").write_text('{"modified": true}')
+
+        result = verify_checkpoint(project_with_files, second.id)
+        backup = project_with_files / ".harness" / "checkpoints" / second.id / "features.json"
+        assert result["valid"] is True
+        assert backup.read_text() == PROJECT_FILES["features.json"]
+
+
 class TestRollbackToCheckpoint:
     """Tests for rollback_to_checkpoint function."""
 
@@ -150,6 +223,7 @@ class TestRollbackToCheckpoint:
         assert result.success
         assert "features.json" in result.files_restored
         assert features_path.read_text() == original_content
+        assert result.git_ref_after is None
 
     def test_rollback_to_missing_checkpoint_raises(self, project_with_files):
         """Test rollback to nonexistent checkpoint raises error."""
@@ -173,7 +247,7 @@ class TestRollbackToCheckpoint:
         result = rollback_to_checkpoint(git_project, checkpoint.id)
 
         assert result.git_restored
-        assert repo.head.commit.hexsha == checkpoint.git_ref
+        assert result.git_ref_after == checkpoint.git_ref
 
 
 class TestGetCheckpoint:
@@ -188,6 +262,30 @@ class TestGetCheckpoint:
         assert retrieved.id == created.id
         assert retrieved.session == created.session
 
+    def test_get_checkpoint_sees_rewritten_metadata(self, project_with_files):
+        """Test that a cached checkpoint is reloaded after its metadata changes."""
+        created = create_checkpoint(project_with_files, session=1, reason="Test")
+        assert get_checkpoint(project_with_files, created.id).reason == "Test"
+
+        metadata_path = (
+            project_with_files / ".harness" / "checkpoints" / created.id / "checkpoint.json"
+        )
+        data = json.loads(metadata_path.read_text())
+        data["reason"] = "Edited reason"
+        metadata_path.write_text(json.dumps(data))
+
+        assert get_checkpoint(project_with_files, created.id).reason == "Edited reason"
+
+    def test_get_checkpoint_returns_independent_objects(self, project_with_files):
+        """Test that mutating a returned checkpoint does not leak into later calls."""
+        created = create_checkpoint(project_with_files, session=1, reason="Test")
+
+        first = get_checkpoint(project_with_files, created.id)
+        first.files_backed_up.clear()
+
+        second = get_checkpoint(project_with_files, created.id)
+        assert "features.json" in second.files_backed_up
+
     def test_get_nonexistent_checkpoint(self, project_with_files):
         """Test getting nonexistent checkpoint returns None."""
         result = get_checkpoint(project_with_files, "nonexistent")
@@ -226,6 +324,15 @@ class TestListCheckpoints:
         assert len(checkpoints) == 2
         assert all(c.session == 2 for c in checkpoints)
 
+    def test_list_checkpoints_for_session_does_not_match_prefix(self, project_with_files):
+        """Test that session 1 does not pick up checkpoints from session 10."""
+        create_checkpoint(project_with_files, session=1, reason="First")
+        create_checkpoint(project_with_files, session=10, reason="Tenth")
+
+        checkpoints = list_checkpoints_for_session(project_with_files, session=1)
+
+        assert [c.reason for c in checkpoints] == ["First"]
+
 
 class TestCleanupCheckpoints:
     """Tests for cleanup_old_checkpoints function."""
@@ -262,6 +369,31 @@ class TestCleanupCheckpoints:
         assert deleted == 1
         assert get_checkpoint_count(project_with_files) == 1
 
+    def test_cleanup_keeps_newest_per_session(self, project_with_files):
+        """Test that the newest checkpoints per session survive cleanup."""
+        create_checkpoint(project_with_files, session=1, reason="Older")
+        create_checkpoint(project_with_files, session=1, reason="Newer")
+
+        # Age both checkpoints past the cutoff
+        old_time = datetime.now(timezone.utc) - timedelta(days=10)
+        for i, checkpoint in enumerate(reversed(list_checkpoints(project_with_files))):
+            metadata_path = (
+                project_with_files / ".harness" / "checkpoints" / checkpoint.id / "checkpoint.json"
+            )
+            data = json.loads(metadata_path.read_text())
+            data["timestamp"] = (old_time + timedelta(minutes=i)).isoformat().replace("+00:00", "Z")
+            metadata_path.write_text(json.dumps(data))
+
+        deleted = cleanup_old_checkpoints(
+            project_with_files,
+            max_age_days=7,
+            keep_per_session=1,
+        )
+
+        assert deleted == 1
+        remaining = list_checkpoints(project_with_files)
+        assert [c.reason for c in remaining] == ["Newer"]
+
 
 class TestDeleteCheckpoint:
     """Tests for delete_checkpoint function."""
@@ -275,6 +407,17 @@ class TestDeleteCheckpoint:
         assert result is True
         assert get_checkpoint(project_with_files, checkpoint.id) is None
 
+    def test_delete_checkpoint_with_corrupt_metadata(self, project_with_files):
+        """Test a checkpoint whose metadata cannot be parsed is still deleted."""
+        checkpoint = create_checkpoint(project_with_files, session=1, reason="Test")
+        checkpoint_path = project_with_files / ".harness" / "checkpoints" / checkpoint.id
+        (checkpoint_path / "checkpoint.json").write_text("{not json")
+
+        result = delete_checkpoint(project_with_files, checkpoint.id)
+
+        assert result is True
+        assert not checkpoint_path.exists()
+
     def test_delete_nonexistent_checkpoint(self, project_with_files):
         """Test deleting nonexistent checkpoint returns False."""
         result = delete_checkpoint(project_with_files, "nonexistent")
@@ -49,6 +49,21 @@ class TestMainGroup:
         assert result.exit_code == 0
         assert "Universal Agent Harness" in result.output
 
+    def test_help_is_stable_across_invocations(self, runner):
+        """Repeated --help renders identical output for the group and subcommands."""
+        for args in (["--help"], ["run", "--help"]):
+            first = runner.invoke(main, args)
+            second = runner.invoke(main, args)
+            assert first.exit_code == 0
+            assert first.output == second.output
+
+    def test_help_respects_invocation_name(self, runner):
+        """Cached help is keyed on the command path used to invoke it."""
+        as_harness = runner.invoke(main, ["run", "--help"], prog_name="harness")
+        as_other = runner.invoke(main, ["run", "--help"], prog_name="other")
+        assert "harness run" in as_harness.output
+        assert "other run" in as_other.output
+
 
 class TestVersionCommand:
     """Tests for version command."""
@@ -10,6 +10,7 @@ from agent_harness.config import (
     save_config,
     ProjectConfig,
     CostsConfig,
+    _validate_config,
 )
 from agent_harness.exceptions import ConfigError, ConfigValidationError
 
@@ -26,27 +27,41 @@ class TestConfigDefaults:
         assert config.context.force_threshold == 0.90
         assert config.verification.max_features_per_session == 1
 
-    def test_default_models(self):
+    def test_default_models(self, default_config):
         """Default model configuration."""
-        config = get_default_config()
+        config = default_config
         assert config.models.default == "claude-sonnet-4"
         assert config.models.coding == "claude-sonnet-4"
         assert config.models.cleanup == "claude-haiku-3"
 
-    def test_default_paths(self):
+    def test_default_paths(self, default_config):
         """Default paths configuration."""
-        config = get_default_config()
+        config = default_config
         assert config.paths.features == "features.json"
         assert config.paths.progress == "claude-progress.txt"
         assert config.paths.state_dir == ".harness"
 
-    def test_default_tools(self):
+    def test_default_tools(self, default_config):
         """Default tools configuration."""
-        config = get_default_config()
+        config = default_config
         assert config.tools.filesystem.enabled is True
         assert config.tools.shell.enabled is True
         assert config.tools.shell.timeout_seconds == 300
 
+    def test_default_config_is_valid(self, default_config):
+        """Defaults must pass validation (load_config relies on this)."""
+        _validate_config(default_config)
+
+    def test_get_default_config_returns_fresh_instances(self):
+        """Each call should return an independent Config."""
+        first = get_default_config()
+        first.project.name = "changed"
+        first.tools.filesystem.allowed_paths.append("extra")
+
+        second = get_default_config()
+        assert second.project.name == "unnamed-project"
+        assert second.tools.filesystem.allowed_paths == ["."]
+
 
 class TestConfigLoading:
     """Test configuration file loading."""
@@ -91,6 +106,30 @@ project:
         assert config.costs.per_session_usd == 10.0
         assert config.context.warn_threshold == 0.75
 
+    def test_load_utf8_config(self, temp_project_dir):
+        """Non-ASCII UTF-8 content should load correctly."""
+        config_path = temp_project_dir / ".harness.yaml"
+        config_path.write_text("project:\n  description: Café ☕ naïve\n", encoding="utf-8")
+
+        config = load_config(temp_project_dir)
+        assert config.project.description == "Café ☕ naïve"
+
+    def test_load_ignores_unknown_keys(self, temp_project_dir):
+        """Unknown top-level and nested keys should be ignored."""
+        config_content = """
+unknown_section:
+  value: 1
+project:
+  name: known
+  not_a_field: true
+"""
+        config_path = temp_project_dir / ".harness.yaml"
+        config_path.write_text(config_content)
+
+        config = load_config(temp_project_dir)
+        assert config.project.name == "known"
+        assert not hasattr(config.project, "not_a_field")
+
     def test_load_invalid_yaml_raises_error(self, temp_project_dir):
         """Invalid YAML should raise ConfigError."""
         config_path = temp_project_dir / ".harness.yaml"
@@ -99,6 +138,55 @@ project:
         with pytest.raises(ConfigError):
             load_config(temp_project_dir)
 
+    def test_reload_picks_up_file_changes(self, temp_project_dir):
+        """Editing .harness.yaml between loads should be reflected."""
+        config_path = temp_project_dir / ".harness.yaml"
+        config_path.write_text("project:\n  name: first\n")
+        assert load_config(temp_project_dir).project.name == "first"
+
+        config_path.write_text("project:\n  name: second-name\n")
+        assert load_config(temp_project_dir).project.name == "second-name"
+
+    def test_repeated_loads_return_independent_configs(self, temp_project_dir):
+        """Mutating a loaded config should not affect later loads."""
+        config_path = temp_project_dir / ".harness.yaml"
+        config_path.write_text("project:\n  name: original\n")
+
+        first = load_config(temp_project_dir)
+        first.project.name = "mutated"
+        first.tools.filesystem.allowed_paths.append("extra")
+
+        second = load_config(temp_project_dir)
+        assert second.project.name == "original"
+        assert second.tools.filesystem.allowed_paths == ["."]
+
+    def test_cached_config_nested_dicts_are_independent(self, temp_project_dir):
+        """Nested free-form dicts are not shared between loads."""
+        config_path = temp_project_dir / ".harness.yaml"
+        config_path.write_text(
+            "tools:\n  mcp_servers:\n    postgres:\n"
+            "      config:\n        pool: {size: 2}\n"
+        )
+
+        first = load_config(temp_project_dir)
+        first.tools.mcp_servers.postgres.config["pool"]["size"] = 9
+
+        second = load_config(temp_project_dir)
+        assert second.tools.mcp_servers.postgres.config == {"pool": {"size": 2}}
+
+    def test_identical_files_in_different_projects(self, tmp_path):
+        """Projects sharing the same config contents load independently."""
+        content = "tools:\n  filesystem:\n    allowed_paths: [src]\n"
+        for name in ("one", "two"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / ".harness.yaml").write_text(content)
+
+        first = load_config(tmp_path / "one")
+        first.tools.filesystem.allowed_paths.append("extra")
+
+        second = load_config(tmp_path / "two")
+        assert second.tools.filesystem.allowed_paths == ["src"]
+
 
 class TestConfigValidation:
     """Test configuration validation."""
@@ -166,6 +254,15 @@ costs:
         with pytest.raises(ConfigValidationError):
             load_config(temp_project_dir)
 
+    def test_invalid_config_fails_on_every_load(self, temp_project_dir):
+        """Invalid contents are never remembered as validated."""
+        config_path = temp_project_dir / ".harness.yaml"
+        config_path.write_text("costs:\n  per_session_usd: -5.0\n")
+
+        for _ in range(2):
+            with pytest.raises(ConfigValidationError):
+                load_config(temp_project_dir)
+
 
 class TestConfigSaving:
     """Test configuration saving."""
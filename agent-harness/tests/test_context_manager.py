@@ -81,6 +81,18 @@ class TestContextManager:
         manager.update_usage(input_tokens=2000, output_tokens=1000)
         assert manager.tokens_used == 4500
 
+    def test_usable_tokens(self):
+        """Usable tokens should exclude the response reserve."""
+        manager = ContextManager(reserve_tokens=8000)
+        assert manager.usable_tokens == 200000 - 8000
+
+    def test_reserve_exceeding_window_counts_as_full(self):
+        """A reserve larger than the window should leave no usable context."""
+        manager = ContextManager(reserve_tokens=300000)
+        assert manager.percentage_used == 1.0
+        assert manager.tokens_remaining == 0
+        assert manager.can_continue() is False
+
     def test_percentage_used(self):
         """Percentage should be calculated correctly."""
         manager = ContextManager()
@@ -181,6 +193,16 @@ class TestContextManager:
         assert warning.level == "hard_stop"
         assert warning.force_action is True
 
+    def test_check_and_warn_hard_stop_repeats(self):
+        """Hard stop is returned on every check, as a fresh warning each time."""
+        manager = ContextManager()
+        manager.update_usage(input_tokens=manager.usable_tokens, output_tokens=0)
+
+        first = manager.check_and_warn()
+        second = manager.check_and_warn()
+        assert first.level == second.level == "hard_stop"
+        assert first is not second
+
     def test_can_continue(self):
         """can_continue should return False when exceeded."""
         manager = ContextManager()
@@ -2,8 +2,10 @@
 
 import pytest
 from pathlib import Path
+import yaml
 
 from agent_harness.costs import (
+    MODEL_PRICING,
     SessionCost,
     BudgetCheck,
     CostTracker,
@@ -86,6 +88,23 @@ class TestLoadSaveCosts:
         assert loaded.by_feature[1] == 10.0
         assert loaded.by_feature[2] == 15.5
 
+    def test_loaded_history_shares_model_strings(self, tmp_path):
+        """Test that loaded session history entries share model name strings."""
+        costs_path = tmp_path / "costs.yaml"
+        tracker = CostTracker(
+            session_history=[
+                SessionCost(session_id=1, model="claude-haiku-3"),
+                SessionCost(session_id=2, model="claude-haiku-3"),
+            ],
+        )
+
+        save_costs(costs_path, tracker)
+        loaded = load_costs(costs_path)
+
+        first, second = loaded.session_history
+        assert first.model == "claude-haiku-3"
+        assert first.model is second.model
+
     def test_load_missing_file_returns_empty(self, tmp_path):
         """Test loading from missing file returns empty tracker."""
         loaded = load_costs(tmp_path / "missing.yaml")
@@ -100,6 +119,39 @@ class TestLoadSaveCosts:
         save_costs(costs_path, tracker)
         assert costs_path.exists()
 
+    def test_saved_costs_are_valid_yaml(self, tmp_path):
+        """Test that the saved JSON remains readable as YAML."""
+        costs_path = tmp_path / "costs.yaml"
+        save_costs(costs_path, CostTracker(total_sessions=2, by_feature={3: 1.5}))
+
+        data = yaml.safe_load(costs_path.read_text())
+        assert data["total_sessions"] == 2
+        assert data["by_feature"] == {"3": 1.5}
+
+    def test_load_legacy_yaml_costs(self, tmp_path):
+        """Test loading a costs file written in YAML format."""
+        costs_path = tmp_path / "costs.yaml"
+        costs_path.write_text(
+            "total_sessions: 3\n"
+            "total_cost_usd: 7.5\n"
+            "by_feature:\n"
+            "  4: 2.5\n"
+        )
+
+        loaded = load_costs(costs_path)
+
+        assert loaded.total_sessions == 3
+        assert loaded.total_cost_usd == 7.5
+        assert loaded.by_feature == {4: 2.5}
+
+    def test_load_invalid_costs_raises(self, tmp_path):
+        """Test that an unparseable costs file raises StateError."""
+        costs_path = tmp_path / "costs.yaml"
+        costs_path.write_text("invalid: yaml: content: [")
+
+        with pytest.raises(StateError, match="Invalid YAML"):
+            load_costs(costs_path)
+
 
 class TestCalculateCost:
     """Tests for cost calculation functions."""
@@ -150,6 +202,18 @@ class TestCalculateCost:
         # Should use default pricing (same as Sonnet)
         assert cost == pytest.approx(18.0, rel=0.01)
 
+    def test_calculate_cost_matches_pricing_table(self):
+        """Test that every priced model is charged its listed rates."""
+        for model, pricing in MODEL_PRICING.items():
+            cost = calculate_cost(
+                input_tokens=2_000_000,
+                output_tokens=1_000_000,
+                cached_tokens=4_000_000,
+                model=model,
+            )
+            expected = 2 * pricing["input"] + pricing["output"] + 4 * pricing["cached"]
+            assert cost == pytest.approx(expected)
+
 
 class TestSessionManagement:
     """Tests for session management functions."""
@@ -291,6 +355,39 @@ class TestBudgetChecking:
         assert result.within_budget is False
         assert result.budget_type == "project"
 
+    def test_check_budget_reports_session_before_project(self):
+        """Test that the session limit is reported when several are exceeded."""
+        tracker = CostTracker(total_cost_usd=250.0)
+        start_session(tracker, session_id=1, feature_id=7)
+        tracker.current_session.cost_usd = 15.0
+        tracker.by_feature[7] = 30.0
+
+        config = CostsConfig(
+            per_session_usd=10.0,
+            per_feature_usd=25.0,
+            total_project_usd=200.0,
+        )
+
+        result = check_budget(tracker, config)
+
+        assert result.budget_type == "session"
+
+    def test_check_budget_reports_feature_before_project(self):
+        """Test that the feature limit takes precedence over the project limit."""
+        tracker = CostTracker(total_cost_usd=250.0)
+        start_session(tracker, session_id=1, feature_id=7)
+        tracker.by_feature[7] = 30.0
+
+        config = CostsConfig(
+            per_session_usd=10.0,
+            per_feature_usd=25.0,
+            total_project_usd=200.0,
+        )
+
+        result = check_budget(tracker, config)
+
+        assert result.budget_type == "feature"
+
     def test_check_budget_or_raise(self):
         """Test check_budget_or_raise raises on exceeded."""
         tracker = CostTracker(total_cost_usd=250.0)
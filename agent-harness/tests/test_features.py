@@ -174,6 +174,29 @@ class TestLoadSaveFeatures:
         assert loaded.project == sample_features_file.project
         assert len(loaded.features) == len(sample_features_file.features)
 
+    def test_save_and_reload_preserves_all_fields(self, temp_project_dir):
+        """Every feature field should survive a save/load round trip."""
+        feature = Feature(
+            id=7,
+            category="api",
+            description="Full feature",
+            test_file="tests/test_full.py",
+            verification_steps=["step one", "step two"],
+            size_estimate="large",
+            depends_on=[3],
+            passes=True,
+            origin="existing",
+            verification_type="hybrid",
+            note="café",
+        )
+        features_file = FeaturesFile(
+            project="p", generated_by="g", init_mode="adopt", last_updated="", features=[feature]
+        )
+        features_path = temp_project_dir / "features.json"
+        save_features(features_path, features_file)
+
+        assert load_features(features_path).features == [feature]
+
 
 class TestGetNextFeature:
     """Test get_next_feature function."""
@@ -231,6 +254,23 @@ class TestFeatureQueries:
         feature = get_feature_by_id(sample_features_file, 999)
         assert feature is None
 
+    def test_get_feature_by_id_after_list_changes(self, sample_features_file):
+        """Lookups should reflect features added, replaced or renumbered."""
+        features = sample_features_file.features
+        assert get_feature_by_id(sample_features_file, 2) is features[1]
+
+        added = Feature(id=10, category="core", description="New", test_file="n.py")
+        features.append(added)
+        assert get_feature_by_id(sample_features_file, 10) is added
+
+        replacement = Feature(id=20, category="core", description="R", test_file="r.py")
+        features[1] = replacement
+        assert get_feature_by_id(sample_features_file, 2) is None
+        assert get_feature_by_id(sample_features_file, 20) is replacement
+
+        features[0].id = 30
+        assert get_feature_by_id(sample_features_file, 30) is features[0]
+
     def test_get_features_by_status_passing(self, sample_features_file):
         """Should return passing features."""
         passing = get_features_by_status(sample_features_file, passes=True)
@@ -278,6 +318,29 @@ class TestDependencyCycles:
         cycles = detect_dependency_cycles(features)
         assert len(cycles) > 0
 
+    def test_cycle_is_closed_path(self):
+        """Reported cycle should follow dependency edges back to its start."""
+        features = [
+            Feature(id=1, category="core", description="A", test_file="a.py", depends_on=[2]),
+            Feature(id=2, category="core", description="B", test_file="b.py", depends_on=[3]),
+            Feature(id=3, category="core", description="C", test_file="c.py", depends_on=[1]),
+            Feature(id=4, category="core", description="D", test_file="d.py", depends_on=[1]),
+        ]
+        cycles = detect_dependency_cycles(features)
+        assert len(cycles) == 1
+        cycle = cycles[0]
+        assert cycle[0] == cycle[-1]
+        assert sorted(cycle[:-1]) == [1, 2, 3]
+
+    def test_long_chain_does_not_recurse(self):
+        """Deep dependency chains should not hit the recursion limit."""
+        features = [
+            Feature(id=i, category="core", description="F", test_file="f.py", depends_on=[i + 1])
+            for i in range(5000)
+        ]
+        features.append(Feature(id=5000, category="core", description="F", test_file="f.py"))
+        assert detect_dependency_cycles(features) == []
+
 
 class TestValidateFeatures:
     """Test features validation."""
@@ -340,6 +403,27 @@ class TestValidateFeatures:
         assert result.valid is True
         assert len(result.warnings) > 0
 
+    def test_errors_grouped_by_kind(self):
+        """Errors should be reported by kind, then in feature order."""
+        features_file = FeaturesFile(
+            project="test",
+            generated_by="test",
+            init_mode="new",
+            last_updated="2025-01-01",
+            features=[
+                Feature(id=1, category="core", description="A", test_file="a.py", depends_on=[1]),
+                Feature(id=2, category="core", description="B", test_file="b.py", depends_on=[98]),
+                Feature(id=3, category="core", description="C", test_file="c.py", depends_on=[99]),
+            ],
+        )
+        result = validate_features(features_file)
+        assert result.errors == [
+            "Dependency cycle detected: 1 -> 1",
+            "Feature 2 depends on non-existent features: [98]",
+            "Feature 3 depends on non-existent features: [99]",
+            "Feature 1 depends on itself",
+        ]
+
 
 class TestFeatureProgress:
     """Test feature progress functions."""
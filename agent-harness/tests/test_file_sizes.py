@@ -155,6 +155,21 @@ class TestCountLines:
         count = count_lines(tmp_path / "missing.py")
         assert count == 0
 
+    def test_count_lines_without_trailing_newline(self, tmp_path):
+        """A final line without a newline still counts."""
+        test_file = tmp_path / "test.py"
+        test_file.write_bytes(b"line1\r\nline2\r\nline3")
+
+        assert count_lines(test_file) == 3
+
+    def test_count_lines_across_read_chunks(self, tmp_path, monkeypatch):
+        """Line counts should not depend on where read chunks split."""
+        monkeypatch.setattr("agent_harness.file_sizes._COUNT_CHUNK_SIZE", 4)
+        test_file = tmp_path / "test.py"
+        test_file.write_bytes(b"abc\ndefg\nhij")
+
+        assert count_lines(test_file) == 3
+
 
 class TestScanFileSizes:
     """Tests for scanning file sizes."""
@@ -195,6 +210,18 @@ class TestScanFileSizes:
         assert "main.py" in sizes
         assert "__pycache__/main.cpython-311.pyc" not in sizes
 
+    def test_scan_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Threaded line counting should give the same results."""
+        for i in range(20):
+            (tmp_path / f"mod{i}.py").write_text("x\n" * i)
+
+        serial = scan_file_sizes(tmp_path)
+        monkeypatch.setattr("agent_harness.file_sizes._PARALLEL_SCAN_MIN_FILES", 1)
+        parallel = scan_file_sizes(tmp_path)
+
+        assert parallel == serial
+        assert parallel["mod7.py"] == 7
+
     def test_scan_missing_directory(self, tmp_path):
         """Test scanning missing directory returns empty."""
         sizes = scan_file_sizes(tmp_path / "missing")
@@ -303,6 +330,15 @@ class TestLargestFiles:
         assert largest[0] == ("huge.py", 1000)
         assert largest[1] == ("large.py", 500)
 
+    def test_get_largest_files_ties_keep_tracker_order(self):
+        """Equal sizes should be returned in the order files were tracked."""
+        tracker = FileSizeTracker(session=1)
+        for name in ("b.py", "a.py", "c.py"):
+            tracker.add_file(name, 50)
+
+        assert get_largest_files(tracker, n=2) == [("b.py", 50), ("a.py", 50)]
+        assert get_largest_files(tracker, n=10) == [("b.py", 50), ("a.py", 50), ("c.py", 50)]
+
 
 class TestNewFiles:
     """Tests for finding new files."""
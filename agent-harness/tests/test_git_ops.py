@@ -29,23 +29,21 @@ from agent_harness.git_ops import (
 )
 from agent_harness.exceptions import GitError
 
-from git import Repo
 
+def _quick_commit(repo, files, message):
+    """Write files and commit them through a single in-memory index.
 
-@pytest.fixture
-def git_repo(tmp_path):
-    """Create a temporary git repository."""
-    repo = Repo.init(tmp_path)
-    repo.config_writer().set_value("user", "name", "Test User").release()
-    repo.config_writer().set_value("user", "email", "test@example.com").release()
-
-    # Create initial commit
-    test_file = tmp_path / "initial.txt"
-    test_file.write_text("initial content")
-    repo.index.add(["initial.txt"])
-    repo.index.commit("Initial commit")
-
-    return tmp_path
+    Staging with ``write=False`` skips rewriting the index file on every
+    add; it is flushed once after the commit.
+    """
+    root = Path(repo.working_tree_dir)
+    for name, content in files.items():
+        (root / name).write_text(content)
+    index = repo.index
+    index.add(list(files), write=False)
+    commit = index.commit(message)
+    index.write()
+    return commit
 
 
 class TestGetRepo:
@@ -109,11 +107,10 @@ class TestIsDetachedHead:
         """Test detecting non-detached HEAD."""
         assert is_detached_head(git_repo) is False
 
-    def test_detached_head(self, git_repo):
+    def test_detached_head(self, git_repo, git_repo_obj):
         """Test detecting detached HEAD."""
-        repo = Repo(git_repo)
-        head_sha = repo.head.commit.hexsha
-        repo.head.reference = repo.commit(head_sha)
+        head_sha = git_repo_obj.head.commit.hexsha
+        git_repo_obj.head.reference = git_repo_obj.commit(head_sha)
 
         assert is_detached_head(git_repo) is True
 
@@ -135,19 +132,13 @@ class TestGetHeadRef:
 class TestCommitsBetween:
     """Tests for commits_between function."""
 
-    def test_commits_between(self, git_repo):
+    def test_commits_between(self, git_repo, git_repo_obj):
         """Test listing commits between refs."""
-        repo = Repo(git_repo)
-        initial_sha = repo.head.commit.hexsha
+        initial_sha = git_repo_obj.head.commit.hexsha
 
         # Create more commits
-        (git_repo / "file1.txt").write_text("content")
-        repo.index.add(["file1.txt"])
-        repo.index.commit("Second commit")
-
-        (git_repo / "file2.txt").write_text("content")
-        repo.index.add(["file2.txt"])
-        repo.index.commit("Third commit")
+        _quick_commit(git_repo_obj, {"file1.txt": "content"}, "Second commit")
+        _quick_commit(git_repo_obj, {"file2.txt": "content"}, "Third commit")
 
         commits = commits_between(git_repo, initial_sha, "HEAD")
         assert len(commits) == 2
@@ -161,19 +152,17 @@ class TestCommitsBetween:
 class TestResetHard:
     """Tests for reset_hard function."""
 
-    def test_reset_hard(self, git_repo):
+    def test_reset_hard(self, git_repo, git_repo_obj):
         """Test hard reset."""
-        repo = Repo(git_repo)
-        initial_sha = repo.head.commit.hexsha
+        initial_sha = git_repo_obj.head.commit.hexsha
 
         # Make changes and commit
-        (git_repo / "new.txt").write_text("content")
-        repo.index.add(["new.txt"])
-        repo.index.commit("New commit")
+        _quick_commit(git_repo_obj, {"new.txt": "content"}, "New commit")
 
         # Reset back
-        reset_hard(git_repo, initial_sha)
+        new_sha = reset_hard(git_repo, initial_sha)
 
+        assert new_sha == initial_sha
         assert get_head_ref(git_repo) == initial_sha
         assert not (git_repo / "new.txt").exists()
 
@@ -195,13 +184,12 @@ class TestCreateCommit:
         assert len(sha) == 40
         assert "Test commit" in get_commit_message(git_repo)
 
-    def test_create_commit_specific_files(self, git_repo):
+    def test_create_commit_specific_files(self, git_repo, git_repo_obj):
         """Test creating commit with specific files."""
         (git_repo / "staged.txt").write_text("staged")
         (git_repo / "unstaged.txt").write_text("unstaged")
 
-        repo = Repo(git_repo)
-        repo.index.add(["staged.txt"])
+        git_repo_obj.index.add(["staged.txt"])
 
         sha = create_commit(git_repo, "Staged only", files=["staged.txt"])
 
@@ -244,18 +232,37 @@ class TestGetChangedFiles:
         assert "initial.txt" in changed
         assert "new.txt" in changed
 
-    def test_get_staged_files(self, git_repo):
+    def test_get_changed_files_deleted_and_nested(self, git_repo):
+        """Deleted files and files in untracked directories are listed by path."""
+        (git_repo / "initial.txt").unlink()
+        (git_repo / "pkg" / "sub").mkdir(parents=True)
+        (git_repo / "pkg" / "sub" / "mod.py").write_text("x")
+        (git_repo / "with space.txt").write_text("y")
+
+        changed = get_changed_files(git_repo)
+
+        assert changed == ["initial.txt", "pkg/sub/mod.py", "with space.txt"]
+
+    def test_get_staged_files(self, git_repo, git_repo_obj):
         """Test getting only staged files."""
-        repo = Repo(git_repo)
         (git_repo / "staged.txt").write_text("staged")
         (git_repo / "unstaged.txt").write_text("unstaged")
-        repo.index.add(["staged.txt"])
+        git_repo_obj.index.add(["staged.txt"])
 
         staged = get_changed_files(git_repo, staged=True)
 
         assert "staged.txt" in staged
         assert "unstaged.txt" not in staged
 
+    def test_get_staged_files_includes_deletions(self, git_repo, git_repo_obj):
+        """Staged deletions and nested paths are listed in sorted order."""
+        (git_repo / "pkg").mkdir()
+        (git_repo / "pkg" / "mod.py").write_text("x = 1\n")
+        git_repo_obj.index.add(["pkg/mod.py"])
+        git_repo_obj.index.remove(["initial.txt"], working_tree=True)
+
+        assert get_changed_files(git_repo, staged=True) == ["initial.txt", "pkg/mod.py"]
+
 
 class TestGetUntrackedFiles:
     """Tests for get_untracked_files function."""
@@ -312,15 +319,11 @@ class TestGetCommitInfo:
         assert "Initial commit" in info["message"]
         assert info["author"] == "Test User"
 
-    def test_get_recent_commits(self, git_repo):
+    def test_get_recent_commits(self, git_repo, git_repo_obj):
         """Test getting recent commits."""
-        repo = Repo(git_repo)
-
         # Add more commits
         for i in range(3):
-            (git_repo / f"file{i}.txt").write_text("content")
-            repo.index.add([f"file{i}.txt"])
-            repo.index.commit(f"Commit {i}")
+            _quick_commit(git_repo_obj, {f"file{i}.txt": "content"}, f"Commit {i}")
 
         commits = get_recent_commits(git_repo, n=2)
 
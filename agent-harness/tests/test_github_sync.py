@@ -18,11 +18,30 @@ from agent_harness.github_sync import (
     sync_to_github,
     get_sync_status,
     format_sync_status,
+    _run_gh_command,
 )
 from agent_harness.features import Feature, FeaturesFile
 from agent_harness.config import GithubConfig
 
 
+@pytest.fixture(autouse=True)
+def reset_gh_caches(monkeypatch):
+    """Start every test without a remembered gh login or repo lookup."""
+    monkeypatch.setattr("agent_harness.github_sync._gh_authenticated", False)
+    monkeypatch.setattr("agent_harness.github_sync._repo_info_cache", {})
+
+
+@pytest.fixture(autouse=True)
+def mock_run(monkeypatch):
+    """Replace gh invocations for every test; tests set return_value as needed.
+
+    Unconfigured calls fail as they would without gh installed.
+    """
+    mock = Mock(return_value=(False, "", "gh CLI not found"))
+    monkeypatch.setattr("agent_harness.github_sync._run_gh_command", mock)
+    return mock
+
+
 @pytest.fixture
 def sample_features():
     """Create sample features file."""
@@ -115,10 +134,33 @@ class TestSyncResult:
         assert len(result.errors) == 2
 
 
+class TestRunGhCommand:
+    """Tests for _run_gh_command function."""
+
+    @patch("agent_harness.github_sync.subprocess.run")
+    def test_run_disables_update_check_and_prompts(self, mock_run):
+        """gh runs non-interactively, without its release check."""
+        mock_run.return_value = Mock(returncode=0, stdout="ok", stderr="")
+
+        assert _run_gh_command(["auth", "status"]) == (True, "ok", "")
+
+        env = mock_run.call_args.kwargs["env"]
+        assert env["GH_NO_UPDATE_NOTIFIER"] == "1"
+        assert env["GH_PROMPT_DISABLED"] == "1"
+        assert "PATH" in env
+
+    @patch("agent_harness.github_sync.subprocess.run", side_effect=FileNotFoundError)
+    def test_run_without_gh_installed(self, mock_run):
+        """A missing gh binary is reported rather than raised."""
+        success, _, stderr = _run_gh_command(["auth", "status"])
+
+        assert success is False
+        assert "gh CLI not found" in stderr
+
+
 class TestCheckGhAuth:
     """Tests for check_gh_auth function."""
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_check_auth_success(self, mock_run):
         """Test successful auth check."""
         mock_run.return_value = (True, "Logged in", "")
@@ -128,7 +170,6 @@ class TestCheckGhAuth:
         assert result is True
         mock_run.assert_called_once_with(["auth", "status"])
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_check_auth_failure(self, mock_run):
         """Test failed auth check."""
         mock_run.return_value = (False, "", "Not authenticated")
@@ -137,11 +178,21 @@ class TestCheckGhAuth:
 
         assert result is False
 
+    def test_check_auth_success_is_remembered(self, mock_run):
+        """Test a successful check is not repeated, but a failure is."""
+        mock_run.return_value = (False, "", "Not authenticated")
+        assert check_gh_auth() is False
+
+        mock_run.return_value = (True, "Logged in", "")
+        assert check_gh_auth() is True
+        assert check_gh_auth() is True
+
+        assert mock_run.call_count == 2
+
 
 class TestGetRepoInfo:
     """Tests for get_repo_info function."""
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_get_repo_info_success(self, mock_run):
         """Test successful repo info retrieval."""
         mock_run.return_value = (
@@ -154,7 +205,6 @@ class TestGetRepoInfo:
 
         assert result == ("testuser", "testrepo")
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_get_repo_info_failure(self, mock_run):
         """Test failed repo info retrieval."""
         mock_run.return_value = (False, "", "Not a repo")
@@ -163,11 +213,26 @@ class TestGetRepoInfo:
 
         assert result is None
 
+    def test_get_repo_info_is_remembered_per_directory(
+        self, mock_run, tmp_path, monkeypatch
+    ):
+        """Test a lookup is reused in the same directory but not across them."""
+        mock_run.return_value = (True, '{"owner": {"login": "u"}, "name": "r"}', "")
+
+        assert get_repo_info() == ("u", "r")
+        assert get_repo_info() == ("u", "r")
+        assert mock_run.call_count == 1
+
+        monkeypatch.chdir(tmp_path)
+        mock_run.return_value = (False, "", "Not a repo")
+        assert get_repo_info() is None
+        assert get_repo_info() is None
+        assert mock_run.call_count == 3
+
 
 class TestListIssues:
     """Tests for list_issues function."""
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_list_issues_success(self, mock_run):
         """Test successful issue listing."""
         mock_run.return_value = (
@@ -183,7 +248,6 @@ class TestListIssues:
         assert issues[0].title == "Issue 1"
         assert "harness" in issues[0].labels
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_list_issues_empty(self, mock_run):
         """Test listing with no issues."""
         mock_run.return_value = (True, "[]", "")
@@ -192,7 +256,6 @@ class TestListIssues:
 
         assert len(issues) == 0
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_list_issues_failure(self, mock_run):
         """Test failed issue listing."""
         mock_run.return_value = (False, "", "Error")
@@ -201,11 +264,26 @@ class TestListIssues:
 
         assert len(issues) == 0
 
+    def test_list_issues_without_body(self, mock_run):
+        """Test summary listing does not ask gh for bodies or URLs."""
+        mock_run.return_value = (
+            True,
+            '[{"number": 1, "title": "Issue 1", "state": "OPEN", "labels": []}]',
+            "",
+        )
+
+        issues = list_issues(include_body=False)
+
+        args = mock_run.call_args[0][0]
+        assert args[args.index("--json") + 1] == "number,title,state,labels"
+        assert issues[0].state == "open"
+        assert issues[0].body is None
+        assert issues[0].url is None
+
 
 class TestGetIssue:
     """Tests for get_issue function."""
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_get_issue_success(self, mock_run):
         """Test successful issue retrieval."""
         mock_run.return_value = (
@@ -219,7 +297,6 @@ class TestGetIssue:
         assert issue is not None
         assert issue.number == 123
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_get_issue_not_found(self, mock_run):
         """Test issue not found."""
         mock_run.return_value = (False, "", "Issue not found")
@@ -249,7 +326,6 @@ class TestFindIssueForFeature:
 class TestCreateIssueForFeature:
     """Tests for create_issue_for_feature function."""
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_create_issue_success(self, mock_run, sample_github_config):
         """Test successful issue creation."""
         mock_run.return_value = (
@@ -271,7 +347,20 @@ class TestCreateIssueForFeature:
         assert issue_num == 456
         mock_run.assert_called_once()
 
-    @patch("agent_harness.github_sync._run_gh_command")
+    def test_created_title_is_found_again(self, mock_run, sample_github_config):
+        """Titles written on create are matched by find_issue_for_feature."""
+        mock_run.return_value = (True, "https://github.com/test/repo/issues/7\n", "")
+        feature = Feature(id=12, category="core", description="Login", test_file="t.py")
+
+        create_issue_for_feature(feature, sample_github_config)
+
+        args = mock_run.call_args[0][0]
+        title = args[args.index("--title") + 1]
+        assert title == "[Feature #12] Login"
+        issue = GitHubIssue(number=7, title=title, state="open", labels=[], body="")
+        assert find_issue_for_feature(12, [issue]) is issue
+        assert find_issue_for_feature(1, [issue]) is None
+
     def test_create_issue_failure(self, mock_run, sample_github_config):
         """Test failed issue creation."""
         mock_run.return_value = (False, "", "Rate limited")
@@ -291,7 +380,6 @@ class TestCreateIssueForFeature:
 class TestCloseIssue:
     """Tests for close_issue function."""
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_close_issue_success(self, mock_run):
         """Test successful issue close."""
         mock_run.return_value = (True, "", "")
@@ -300,7 +388,6 @@ class TestCloseIssue:
 
         assert result is True
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_close_issue_with_comment(self, mock_run):
         """Test closing with comment."""
         mock_run.return_value = (True, "", "")
@@ -308,14 +395,15 @@ class TestCloseIssue:
         result = close_issue(123, comment="Feature verified")
 
         assert result is True
-        # Should have been called twice - once for comment, once for close
-        assert mock_run.call_count == 2
+        # The comment is passed to the close command itself
+        mock_run.assert_called_once_with(
+            ["issue", "close", "123", "--comment", "Feature verified"]
+        )
 
 
 class TestReopenIssue:
     """Tests for reopen_issue function."""
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_reopen_issue_success(self, mock_run):
         """Test successful issue reopen."""
         mock_run.return_value = (True, "", "")
@@ -325,11 +413,19 @@ class TestReopenIssue:
         assert result is True
         mock_run.assert_called_once_with(["issue", "reopen", "123"])
 
+    def test_reopen_issue_with_comment(self, mock_run):
+        """Test reopening with a comment uses a single gh call."""
+        mock_run.return_value = (True, "", "")
+
+        result = reopen_issue(123, comment="Regressed")
+
+        assert result is True
+        mock_run.assert_called_once_with(["issue", "reopen", "123", "--comment", "Regressed"])
+
 
 class TestAddComment:
     """Tests for add_comment function."""
 
-    @patch("agent_harness.github_sync._run_gh_command")
     def test_add_comment_success(self, mock_run):
         """Test successful comment addition."""
         mock_run.return_value = (True, "", "")
@@ -383,6 +479,24 @@ class TestGetSyncStatus:
         assert status["synced"] is False
         assert len(status["mismatched_state"]) == 1
 
+    @patch("agent_harness.github_sync.list_issues")
+    def test_sync_status_orphans_and_untagged(
+        self, mock_list, sample_features, sample_github_config
+    ):
+        """Test issues for unknown features are orphans and untagged issues are ignored."""
+        mock_list.return_value = [
+            GitHubIssue(number=10, title="[Feature #1] Feature 1", state="closed"),
+            GitHubIssue(number=11, title="[Feature #2] Feature 2", state="open"),
+            GitHubIssue(number=12, title="[Feature #3] Feature 3", state="open"),
+            GitHubIssue(number=13, title="[Feature #42] Removed feature", state="open"),
+            GitHubIssue(number=14, title="[Feature #x] Malformed", state="open"),
+        ]
+
+        status = get_sync_status(sample_features, sample_github_config)
+
+        assert status["issues_without_features"] == [13]
+        assert status["issues_open"] == 2
+
 
 class TestFormatSyncStatus:
     """Tests for format_sync_status function."""
@@ -435,6 +549,25 @@ class TestSyncToGitHub:
         assert not result.success
         assert "authenticated" in result.message.lower()
 
+    @patch("agent_harness.github_sync.check_gh_auth")
+    @patch("agent_harness.github_sync.list_issues")
+    def test_sync_can_skip_auth_check(
+        self, mock_list, mock_auth, sample_features, sample_github_config
+    ):
+        """Test callers that already checked auth can skip the gh call."""
+        mock_list.return_value = []
+
+        result = sync_to_github(
+            sample_features,
+            sample_github_config,
+            create_missing=False,
+            close_completed=False,
+            check_auth=False,
+        )
+
+        assert result.success
+        mock_auth.assert_not_called()
+
     @patch("agent_harness.github_sync.check_gh_auth")
     @patch("agent_harness.github_sync.list_issues")
     @patch("agent_harness.github_sync.create_issue_for_feature")
@@ -486,3 +619,59 @@ class TestSyncToGitHub:
         # Feature 1 passes and has open issue, should be closed
         mock_close.assert_called_once()
         assert 10 in result.closed
+
+    @patch("agent_harness.github_sync.check_gh_auth")
+    @patch("agent_harness.github_sync.list_issues")
+    @patch("time.sleep")
+    def test_sync_reopens_regressed_issues(
+        self, mock_sleep, mock_list, mock_auth,
+        mock_run, sample_features, sample_github_config
+    ):
+        """Test sync reopens closed issues for failing features in one call each."""
+        mock_auth.return_value = True
+        mock_list.return_value = [
+            GitHubIssue(number=20, title="[Feature #2] Feature 2", state="closed"),
+        ]
+        mock_run.return_value = (True, "", "")
+
+        result = sync_to_github(
+            sample_features,
+            sample_github_config,
+            create_missing=False,
+            close_completed=False,
+        )
+
+        assert result.success
+        mock_run.assert_called_once_with([
+            "issue", "reopen", "20",
+            "--comment", "Feature #2 is no longer passing. Reopening issue.",
+        ])
+
+    @patch("agent_harness.github_sync.check_gh_auth")
+    @patch("agent_harness.github_sync.list_issues")
+    @patch("agent_harness.github_sync.create_issue_for_feature")
+    @patch("time.sleep")
+    def test_sync_matches_existing_issues_by_feature_id(
+        self, mock_sleep, mock_create, mock_list, mock_auth,
+        sample_features, sample_github_config
+    ):
+        """Test only features without a tagged issue get new ones."""
+        mock_auth.return_value = True
+        mock_list.return_value = [
+            GitHubIssue(number=30, title="[Feature #3] Feature 3", state="open"),
+            GitHubIssue(number=31, title="[Feature #3] Duplicate", state="closed"),
+            GitHubIssue(number=32, title="Untagged", state="open"),
+        ]
+        mock_create.return_value = 100
+
+        result = sync_to_github(
+            sample_features,
+            sample_github_config,
+            create_missing=True,
+            close_completed=False,
+        )
+
+        assert result.success
+        # Feature 3's first issue is open, so only feature 2 needs an issue
+        mock_create.assert_called_once()
+        assert mock_create.call_args[0][0].id == 2
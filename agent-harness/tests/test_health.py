@@ -19,9 +19,9 @@ from agent_harness.file_sizes import FileSizeTracker, FileInfo
 from agent_harness.config import Config
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_features():
-    """Create sample features file."""
+    """Create sample features file, shared by the module; treat as read-only."""
     return FeaturesFile(
         project="test",
         generated_by="test",
@@ -36,9 +36,9 @@ def sample_features():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_file_tracker():
-    """Create sample file size tracker."""
+    """Create sample file size tracker, shared by the module; treat as read-only."""
     tracker = FileSizeTracker(session=1)
     tracker.files = {
         "module1.py": FileInfo(lines=100, session_added=1),
@@ -48,6 +48,120 @@ def sample_file_tracker():
     return tracker
 
 
+@pytest.fixture(scope="module")
+def health_variants():
+    """
+    ProjectHealth scenarios for the report and recommendation tests.
+
+    Built once and shared by the module; treat as read-only. A test that
+    needs a changed field should take its own copy with dataclasses.replace.
+    """
+    return {
+        "report_sample": ProjectHealth(
+            feature_completion=0.75,
+            test_pass_rate=0.90,
+            lint_score=0.85,
+            file_health=0.95,
+            overall=0.86,
+            status="GOOD",
+            features_passing=6,
+            features_total=8,
+            tests_passing=90,
+            tests_total=100,
+            lint_errors=5,
+            lint_warnings=10,
+            oversized_files=1,
+            total_files=20,
+        ),
+        "report_oversized": ProjectHealth(
+            feature_completion=0.50,
+            test_pass_rate=0.80,
+            lint_score=0.90,
+            file_health=0.70,
+            overall=0.70,
+            status="FAIR",
+            oversized_files=3,
+            oversized_file_list=["big1.py", "big2.py", "big3.py"],
+        ),
+        "low_features": ProjectHealth(
+            feature_completion=0.30,
+            test_pass_rate=1.0,
+            lint_score=1.0,
+            file_health=1.0,
+            overall=0.60,
+            status="FAIR",
+            features_passing=3,
+            features_total=10,
+        ),
+        "failing_tests": ProjectHealth(
+            feature_completion=1.0,
+            test_pass_rate=0.70,
+            lint_score=1.0,
+            file_health=1.0,
+            overall=0.80,
+            status="GOOD",
+            tests_passing=70,
+            tests_total=100,
+        ),
+        "lint_errors": ProjectHealth(
+            feature_completion=1.0,
+            test_pass_rate=1.0,
+            lint_score=0.80,
+            file_health=1.0,
+            overall=0.90,
+            status="GOOD",
+            lint_errors=10,
+            lint_warnings=5,
+        ),
+        "oversized": ProjectHealth(
+            feature_completion=1.0,
+            test_pass_rate=1.0,
+            lint_score=1.0,
+            file_health=0.80,
+            overall=0.90,
+            status="GOOD",
+            oversized_files=5,
+        ),
+        "healthy": ProjectHealth(
+            feature_completion=1.0,
+            test_pass_rate=1.0,
+            lint_score=1.0,
+            file_health=1.0,
+            overall=1.0,
+            status="GOOD",
+            lint_errors=0,
+            lint_warnings=0,
+            oversized_files=0,
+        ),
+    }
+
+
+def _uniform_features(passes):
+    """Build four features that all share the same passes value."""
+    return FeaturesFile(
+        project="test",
+        generated_by="test",
+        init_mode="new",
+        last_updated="2024-01-01",
+        features=[
+            Feature(id=i, category="core", description=f"F{i}", test_file=f"t{i}.py", passes=passes)
+            for i in range(1, 5)
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def all_passing_features():
+    """Features file where every feature passes; treat as read-only."""
+    return _uniform_features(passes=True)
+
+
+@pytest.fixture(scope="module")
+def all_failing_features():
+    """Features file where no feature passes; treat as read-only."""
+    return _uniform_features(passes=False)
+
+
 class TestProjectHealth:
     """Tests for ProjectHealth dataclass."""
 
@@ -118,41 +232,15 @@ class TestCalculateQuickHealth:
         assert health.feature_completion == 0.5
         assert health.file_health == 1.0  # Default when no tracker
 
-    def test_quick_health_status_good(self):
+    def test_quick_health_status_good(self, all_passing_features):
         """Test GOOD status when completion is high."""
-        features = FeaturesFile(
-            project="test",
-            generated_by="test",
-            init_mode="new",
-            last_updated="2024-01-01",
-            features=[
-                Feature(id=1, category="core", description="F1", test_file="t1.py", passes=True),
-                Feature(id=2, category="core", description="F2", test_file="t2.py", passes=True),
-                Feature(id=3, category="core", description="F3", test_file="t3.py", passes=True),
-                Feature(id=4, category="core", description="F4", test_file="t4.py", passes=True),
-            ],
-        )
-
-        health = calculate_quick_health(features, None)
+        health = calculate_quick_health(all_passing_features, None)
         assert health.status == "GOOD"
         assert health.overall >= 0.8
 
-    def test_quick_health_status_poor(self):
+    def test_quick_health_status_poor(self, all_failing_features):
         """Test POOR status when completion is low."""
-        features = FeaturesFile(
-            project="test",
-            generated_by="test",
-            init_mode="new",
-            last_updated="2024-01-01",
-            features=[
-                Feature(id=1, category="core", description="F1", test_file="t1.py", passes=False),
-                Feature(id=2, category="core", description="F2", test_file="t2.py", passes=False),
-                Feature(id=3, category="core", description="F3", test_file="t3.py", passes=False),
-                Feature(id=4, category="core", description="F4", test_file="t4.py", passes=False),
-            ],
-        )
-
-        health = calculate_quick_health(features, None)
+        health = calculate_quick_health(all_failing_features, None)
         assert health.status == "POOR"
         assert health.overall < 0.5
 
@@ -160,59 +248,36 @@ class TestCalculateQuickHealth:
 class TestGetColors:
     """Tests for color helper functions."""
 
-    def test_health_color_good(self):
-        """Test green color for GOOD status."""
-        assert get_health_color("GOOD") == "green"
-
-    def test_health_color_fair(self):
-        """Test yellow color for FAIR status."""
-        assert get_health_color("FAIR") == "yellow"
-
-    def test_health_color_poor(self):
-        """Test red color for POOR status."""
-        assert get_health_color("POOR") == "red"
-
-    def test_health_color_unknown(self):
-        """Test default color for unknown status."""
-        assert get_health_color("UNKNOWN") == "white"
-
-    def test_score_color_high(self):
-        """Test green color for high scores."""
-        assert get_score_color(0.9) == "green"
-        assert get_score_color(0.8) == "green"
-
-    def test_score_color_medium(self):
-        """Test yellow color for medium scores."""
-        assert get_score_color(0.7) == "yellow"
-        assert get_score_color(0.5) == "yellow"
-
-    def test_score_color_low(self):
-        """Test red color for low scores."""
-        assert get_score_color(0.4) == "red"
-        assert get_score_color(0.0) == "red"
+    @pytest.mark.parametrize(
+        "status,color",
+        [("GOOD", "green"), ("FAIR", "yellow"), ("POOR", "red"), ("UNKNOWN", "white")],
+    )
+    def test_health_color(self, status, color):
+        """Test each status maps to its color, with white as the default."""
+        assert get_health_color(status) == color
+
+    @pytest.mark.parametrize(
+        "score,color",
+        [
+            (0.9, "green"),
+            (0.8, "green"),
+            (0.7, "yellow"),
+            (0.5, "yellow"),
+            (0.4, "red"),
+            (0.0, "red"),
+        ],
+    )
+    def test_score_color(self, score, color):
+        """Test score thresholds, inclusive at 0.8 and 0.5."""
+        assert get_score_color(score) == color
 
 
 class TestFormatHealthReport:
     """Tests for format_health_report function."""
 
-    def test_format_health_report(self):
+    def test_format_health_report(self, health_variants):
         """Test formatting a health report."""
-        health = ProjectHealth(
-            feature_completion=0.75,
-            test_pass_rate=0.90,
-            lint_score=0.85,
-            file_health=0.95,
-            overall=0.86,
-            status="GOOD",
-            features_passing=6,
-            features_total=8,
-            tests_passing=90,
-            tests_total=100,
-            lint_errors=5,
-            lint_warnings=10,
-            oversized_files=1,
-            total_files=20,
-        )
+        health = health_variants["report_sample"]
 
         report = format_health_report(health)
 
@@ -222,18 +287,9 @@ class TestFormatHealthReport:
         assert "90%" in report  # Test pass rate
         assert "6/8" in report  # Features
 
-    def test_format_health_report_with_oversized_files(self):
+    def test_format_health_report_with_oversized_files(self, health_variants):
         """Test report includes oversized files."""
-        health = ProjectHealth(
-            feature_completion=0.50,
-            test_pass_rate=0.80,
-            lint_score=0.90,
-            file_health=0.70,
-            overall=0.70,
-            status="FAIR",
-            oversized_files=3,
-            oversized_file_list=["big1.py", "big2.py", "big3.py"],
-        )
+        health = health_variants["report_oversized"]
 
         report = format_health_report(health)
 
@@ -244,86 +300,41 @@ class TestFormatHealthReport:
 class TestGetHealthRecommendations:
     """Tests for get_health_recommendations function."""
 
-    def test_recommendations_for_low_feature_completion(self):
+    def test_recommendations_for_low_feature_completion(self, health_variants):
         """Test recommendations when feature completion is low."""
-        health = ProjectHealth(
-            feature_completion=0.30,
-            test_pass_rate=1.0,
-            lint_score=1.0,
-            file_health=1.0,
-            overall=0.60,
-            status="FAIR",
-            features_passing=3,
-            features_total=10,
-        )
+        health = health_variants["low_features"]
 
         recs = get_health_recommendations(health)
 
         assert any("features" in r.lower() for r in recs)
 
-    def test_recommendations_for_failing_tests(self):
+    def test_recommendations_for_failing_tests(self, health_variants):
         """Test recommendations when tests are failing."""
-        health = ProjectHealth(
-            feature_completion=1.0,
-            test_pass_rate=0.70,
-            lint_score=1.0,
-            file_health=1.0,
-            overall=0.80,
-            status="GOOD",
-            tests_passing=70,
-            tests_total=100,
-        )
+        health = health_variants["failing_tests"]
 
         recs = get_health_recommendations(health)
 
         assert any("test" in r.lower() for r in recs)
 
-    def test_recommendations_for_lint_errors(self):
+    def test_recommendations_for_lint_errors(self, health_variants):
         """Test recommendations when there are lint errors."""
-        health = ProjectHealth(
-            feature_completion=1.0,
-            test_pass_rate=1.0,
-            lint_score=0.80,
-            file_health=1.0,
-            overall=0.90,
-            status="GOOD",
-            lint_errors=10,
-            lint_warnings=5,
-        )
+        health = health_variants["lint_errors"]
 
         recs = get_health_recommendations(health)
 
         assert any("lint" in r.lower() for r in recs)
 
-    def test_recommendations_for_oversized_files(self):
+    def test_recommendations_for_oversized_files(self, health_variants):
         """Test recommendations when there are oversized files."""
-        health = ProjectHealth(
-            feature_completion=1.0,
-            test_pass_rate=1.0,
-            lint_score=1.0,
-            file_health=0.80,
-            overall=0.90,
-            status="GOOD",
-            oversized_files=5,
-        )
+        health = health_variants["oversized"]
 
         recs = get_health_recommendations(health)
 
         assert any("oversized" in r.lower() for r in recs)
 
-    def test_no_recommendations_when_healthy(self):
+    def test_no_recommendations_when_healthy(self, health_variants):
         """Test positive message when everything is healthy."""
-        health = ProjectHealth(
-            feature_completion=1.0,
-            test_pass_rate=1.0,
-            lint_score=1.0,
-            file_health=1.0,
-            overall=1.0,
-            status="GOOD",
-            lint_errors=0,
-            lint_warnings=0,
-            oversized_files=0,
-        )
+        health = health_variants["healthy"]
 
         recs = get_health_recommendations(health)
 
@@ -334,19 +345,14 @@ class TestGetHealthRecommendations:
 class TestWeights:
     """Tests for health score weights."""
 
-    def test_weights_sum_to_one(self):
-        """Test that weights sum to 1.0."""
-        total = sum(WEIGHTS.values())
-        assert abs(total - 1.0) < 0.001
-
-    def test_all_weights_positive(self):
-        """Test that all weights are positive."""
-        for weight in WEIGHTS.values():
-            assert weight > 0
-
-    def test_required_weights_exist(self):
-        """Test that required weight keys exist."""
-        assert "feature_completion" in WEIGHTS
-        assert "test_pass_rate" in WEIGHTS
-        assert "lint_score" in WEIGHTS
-        assert "file_health" in WEIGHTS
+    def test_weights_positive_and_sum_to_one(self):
+        """Test that all weights are positive and sum to 1.0."""
+        assert min(WEIGHTS.values()) > 0
+        assert abs(sum(WEIGHTS.values()) - 1.0) < 0.001
+
+    @pytest.mark.parametrize(
+        "key", ["feature_completion", "test_pass_rate", "lint_score", "file_health"]
+    )
+    def test_required_weight_is_positive(self, key):
+        """Test that each required weight exists and is positive."""
+        assert WEIGHTS.get(key, 0) > 0
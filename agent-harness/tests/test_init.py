@@ -1,6 +1,5 @@
 """Tests for project initialization module."""
 
-import json
 from pathlib import Path
 
 import pytest
@@ -18,6 +17,89 @@ from agent_harness.init import (
     validate_initialization,
 )
 from agent_harness.features import FeaturesFile, Feature
+from agent_harness import test_runner
+
+
+@pytest.fixture(autouse=True)
+def no_baseline_test_run(monkeypatch):
+    """Skip the pytest subprocess initialize_project runs for its baseline.
+
+    Test projects here have no tests, so the real run only ever reports
+    "no tests collected" (exit code 5) after spawning a Python process.
+    """
+
+    async def run_tests_async(project_dir, *args, **kwargs):
+        return test_runner.TestRunResult(exit_code=5)
+
+    monkeypatch.setattr("agent_harness.init.run_tests_async", run_tests_async)
+
+
+# validate_initialization and detect_project_mode only read the directory,
+# so these trees are built once per module and shared (treat as read-only).
+@pytest.fixture(scope="module")
+def initialized_project(tmp_path_factory):
+    """Project directory with an initialized .harness skeleton."""
+    root = tmp_path_factory.mktemp("initialized")
+    harness_dir = root / ".harness"
+    harness_dir.mkdir()
+    (harness_dir / "session_state.json").write_text("{}")
+    return root
+
+
+@pytest.fixture(scope="module")
+def python_src_project(tmp_path_factory):
+    """Project directory with ten Python files under src/."""
+    root = tmp_path_factory.mktemp("python-src")
+    src_dir = root / "src"
+    src_dir.mkdir()
+    for i in range(10):
+        (src_dir / f"file{i}.py").write_text("# code")
+    return root
+
+
+@pytest.fixture(scope="module")
+def js_src_project(tmp_path_factory):
+    """Project directory with package.json and ten JavaScript files under src/."""
+    root = tmp_path_factory.mktemp("js-src")
+    (root / "package.json").write_text("{}")
+    src_dir = root / "src"
+    src_dir.mkdir()
+    for i in range(10):
+        (src_dir / f"file{i}.js").write_text("// code")
+    return root
+
+
+_JSON_SPEC_BYTES = b'{"name": "test", "features": []}'
+
+
+@pytest.fixture(scope="module")
+def spec_dir(tmp_path_factory):
+    """Directory holding the module's read-only spec files."""
+    return tmp_path_factory.mktemp("specs")
+
+
+@pytest.fixture(scope="module")
+def md_spec_path(spec_dir):
+    """Markdown spec file."""
+    path = spec_dir / "spec.md"
+    path.write_text("# My Project\n\nDescription here.")
+    return path
+
+
+@pytest.fixture(scope="module")
+def json_spec_path(spec_dir):
+    """JSON spec file."""
+    path = spec_dir / "spec.json"
+    path.write_bytes(_JSON_SPEC_BYTES)
+    return path
+
+
+@pytest.fixture(scope="module")
+def txt_spec_path(spec_dir):
+    """Plain-text spec file."""
+    path = spec_dir / "spec.txt"
+    path.write_text("Build a todo app")
+    return path
 
 
 class TestInitResult:
@@ -83,25 +165,14 @@ class TestDetectProjectMode:
         mode = detect_project_mode(tmp_path)
         assert mode == "new"
 
-    def test_directory_with_src_is_adopt(self, tmp_path):
+    def test_directory_with_src_is_adopt(self, python_src_project):
         """Directory with src folder is adopt mode."""
-        src_dir = tmp_path / "src"
-        src_dir.mkdir()
-        # Create some source files
-        for i in range(10):
-            (src_dir / f"file{i}.py").write_text("# code")
-
-        mode = detect_project_mode(tmp_path)
+        mode = detect_project_mode(python_src_project)
         assert mode == "adopt"
 
-    def test_directory_with_package_json_is_adopt(self, tmp_path):
+    def test_directory_with_package_json_is_adopt(self, js_src_project):
         """Directory with package.json is adopt mode."""
-        (tmp_path / "package.json").write_text("{}")
-        (tmp_path / "src").mkdir()
-        for i in range(10):
-            (tmp_path / "src" / f"file{i}.js").write_text("// code")
-
-        mode = detect_project_mode(tmp_path)
+        mode = detect_project_mode(js_src_project)
         assert mode == "adopt"
 
     def test_minimal_files_is_new(self, tmp_path):
@@ -116,32 +187,22 @@ class TestDetectProjectMode:
 class TestParseSpecFile:
     """Tests for parse_spec_file."""
 
-    def test_parse_markdown_spec(self, tmp_path):
+    def test_parse_markdown_spec(self, md_spec_path):
         """Parse markdown spec file."""
-        spec_file = tmp_path / "spec.md"
-        spec_file.write_text("# My Project\n\nDescription here.")
-
-        result = parse_spec_file(spec_file)
+        result = parse_spec_file(md_spec_path)
         assert "content" in result
         assert "# My Project" in result["content"]
         assert result["format"] == "md"
 
-    def test_parse_json_spec(self, tmp_path):
+    def test_parse_json_spec(self, json_spec_path):
         """Parse JSON spec file."""
-        spec_file = tmp_path / "spec.json"
-        spec_data = {"name": "test", "features": []}
-        spec_file.write_text(json.dumps(spec_data))
-
-        result = parse_spec_file(spec_file)
+        result = parse_spec_file(json_spec_path)
         assert result["name"] == "test"
         assert result["features"] == []
 
-    def test_parse_text_spec(self, tmp_path):
+    def test_parse_text_spec(self, txt_spec_path):
         """Parse text spec file."""
-        spec_file = tmp_path / "spec.txt"
-        spec_file.write_text("Build a todo app")
-
-        result = parse_spec_file(spec_file)
+        result = parse_spec_file(txt_spec_path)
         assert result["content"] == "Build a todo app"
         assert result["format"] == "txt"
 
@@ -216,13 +277,8 @@ class TestCreateDefaultFeatures:
 class TestValidateInitialization:
     """Tests for validate_initialization."""
 
-    def test_valid_initialization(self, tmp_path):
+    def test_valid_initialization(self, initialized_project):
         """Valid initialization has no errors."""
-        # Create harness directory
-        harness_dir = tmp_path / ".harness"
-        harness_dir.mkdir()
-        (harness_dir / "session_state.json").write_text("{}")
-
         features = FeaturesFile(
             project="test",
             generated_by="test",
@@ -238,7 +294,7 @@ class TestValidateInitialization:
             ],
         )
 
-        errors = validate_initialization(tmp_path, features)
+        errors = validate_initialization(initialized_project, features)
         assert errors == []
 
     def test_missing_harness_dir(self, tmp_path):
@@ -261,12 +317,8 @@ class TestValidateInitialization:
         errors = validate_initialization(tmp_path, features)
         assert any(".harness" in e for e in errors)
 
-    def test_empty_features(self, tmp_path):
+    def test_empty_features(self, initialized_project):
         """Empty features list is an error."""
-        harness_dir = tmp_path / ".harness"
-        harness_dir.mkdir()
-        (harness_dir / "session_state.json").write_text("{}")
-
         features = FeaturesFile(
             project="test",
             generated_by="test",
@@ -275,23 +327,19 @@ class TestValidateInitialization:
             features=[],
         )
 
-        errors = validate_initialization(tmp_path, features)
+        errors = validate_initialization(initialized_project, features)
         assert any("No features" in e for e in errors)
 
 
 class TestInitializeProject:
     """Tests for initialize_project."""
 
-    @pytest.mark.asyncio
-    async def test_dry_run_initialization(self, tmp_path):
+    @pytest.mark.asyncio(scope="module")
+    async def test_dry_run_initialization(self, tmp_path, md_spec_path):
         """Dry run initialization works."""
-        # Create spec file
-        spec_file = tmp_path / "spec.md"
-        spec_file.write_text("# Test Project\n\nBuild something.")
-
         config = InitConfig(
             project_dir=tmp_path,
-            spec_file=spec_file,
+            spec_file=md_spec_path,
             mode="new",
             dry_run=True,
         )
@@ -303,7 +351,7 @@ class TestInitializeProject:
         assert (tmp_path / ".harness").exists()
         assert (tmp_path / "features.json").exists()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(scope="module")
     async def test_spec_not_found_error(self, tmp_path):
         """Missing spec file returns error."""
         config = InitConfig(
@@ -320,15 +368,12 @@ class TestInitializeProject:
 class TestInitProject:
     """Tests for init_project helper."""
 
-    @pytest.mark.asyncio
-    async def test_init_project_helper(self, tmp_path):
+    @pytest.mark.asyncio(scope="module")
+    async def test_init_project_helper(self, tmp_path, md_spec_path):
         """init_project helper works (async)."""
-        spec_file = tmp_path / "spec.md"
-        spec_file.write_text("# Test\n\nDescription.")
-
         result = await init_project(
             project_dir=tmp_path,
-            spec_file=spec_file,
+            spec_file=md_spec_path,
             dry_run=True,
         )
 
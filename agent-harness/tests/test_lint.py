@@ -1,7 +1,12 @@
 """Tests for lint.py - Lint runner."""
 
-import pytest
+import shutil
+import subprocess
+from collections import OrderedDict
 from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
 
 from agent_harness.lint import (
     LintIssue,
@@ -19,6 +24,32 @@ from agent_harness.lint import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_lint_cache(monkeypatch):
+    """Give each test empty lint result and Poetry environment caches."""
+    monkeypatch.setattr("agent_harness.lint._lint_cache", OrderedDict())
+    monkeypatch.setattr("agent_harness.lint._poetry_bin_cache", {})
+
+
+@pytest.fixture
+def lint_project(tmp_path):
+    """Project with one Python source file."""
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "main.py").write_text("x = 1\n")
+    return tmp_path
+
+
+@pytest.fixture
+def mock_lint_run(monkeypatch):
+    """Replace the lint subprocess with one reporting a single ruff issue."""
+    run = Mock(return_value=subprocess.CompletedProcess(
+        args=[], returncode=1, stdout="src/main.py:1:1: F401 unused import\n", stderr=""
+    ))
+    monkeypatch.setattr("agent_harness.lint.subprocess.run", run)
+    return run
+
+
 class TestLintIssue:
     """Tests for LintIssue dataclass."""
 
@@ -74,6 +105,21 @@ class TestDetectTool:
         """Test detecting unknown tool."""
         assert _detect_tool("custom_linter src/") == "unknown"
 
+    def test_detect_through_runners_and_paths(self):
+        """Test the tool is found after runner prefixes or as a path."""
+        assert _detect_tool("uv run ruff check .") == "ruff"
+        assert _detect_tool("python -m pylint src/") == "pylint"
+        assert _detect_tool("/usr/local/bin/flake8 src/") == "flake8"
+        assert _detect_tool("poetry run mypy src/") == "mypy"
+        assert _detect_tool("RUFF check") == "ruff"
+
+    def test_detect_windows_executables(self):
+        """Test .exe names and backslash paths are recognized."""
+        assert _detect_tool("ruff.exe check .") == "ruff"
+        assert _detect_tool("flake8.exe src") == "flake8"
+        assert _detect_tool(r"C:\venv\Scripts\pylint.exe src") == "pylint"
+        assert _detect_tool(r".venv\Scripts\mypy src") == "mypy"
+
 
 class TestParseRuffOutput:
     """Tests for parsing ruff output."""
@@ -119,6 +165,23 @@ src/module2.py:5:1: E302 expected 2 blank lines, found 1
         assert "src/module1.py" in files
         assert "src/module2.py" in files
 
+    def test_parse_ruff_full_format_skips_snippets(self):
+        """Test indented source snippets in ruff's full output are ignored."""
+        output = """src/app.py:3:8: F401 [*] `os` imported but unused
+  |
+1 | import sys
+3 | import os
+  |        ^^ F401
+  |
+  = help: Remove unused import: `os`
+    src/app.py:9:1: E999 indented lines are not diagnostics
+
+Found 1 error.
+"""
+        result = _parse_ruff_output(output, exit_code=1)
+
+        assert [(i.file, i.line, i.code) for i in result.issues] == [("src/app.py", 3, "F401")]
+
 
 class TestParseFlake8Output:
     """Tests for parsing flake8 output."""
@@ -191,6 +254,25 @@ class TestGetIssuesByCode:
         assert len(issues) == 2
         assert all(i.code == "E501" for i in issues)
 
+    def test_lookups_follow_issue_list_changes(self):
+        """Test lookups see issues added or replaced after an earlier lookup."""
+        result = LintResult(
+            exit_code=1,
+            issues=[LintIssue("src/a.py", 1, 1, "E501", "Line too long", "error")],
+        )
+        assert len(get_issues_by_code(result, "E501")) == 1
+
+        result.issues.append(LintIssue("src/b.py", 1, 1, "E501", "Line too long", "error"))
+        assert len(get_issues_by_code(result, "E501")) == 2
+
+        result.issues = [LintIssue("src/c.py", 1, 1, "E302", "Blank lines", "error")]
+        assert get_issues_by_code(result, "E501") == []
+        assert len(get_issues_by_code(result, "E302")) == 1
+
+        result.issues[0] = LintIssue("src/c.py", 1, 1, "W291", "Trailing whitespace", "warning")
+        assert get_issues_by_code(result, "E302") == []
+        assert len(get_issues_for_file(result, "src/c.py")) == 1
+
 
 class TestFormatLintSummary:
     """Tests for format_lint_summary function."""
@@ -245,6 +327,21 @@ class TestGetErrorCodesSummary:
         assert summary["E501"] == 3
         assert summary["E302"] == 1
 
+    def test_get_error_codes_summary_missing_code(self):
+        """Test issues without a code are counted as unknown in a plain dict."""
+        result = LintResult(
+            exit_code=1,
+            issues=[
+                LintIssue("a.py", 1, 1, "", "Syntax error", "error"),
+                LintIssue("b.py", 1, 1, "E501", "Line too long", "error"),
+            ],
+        )
+
+        summary = get_error_codes_summary(result)
+
+        assert summary == {"unknown": 1, "E501": 1}
+        assert type(summary) is dict
+
 
 class TestRunLint:
     """Integration tests for run_lint function."""
@@ -258,3 +355,141 @@ class TestRunLint:
         # Just verify it runs without crashing
         result = run_lint(tmp_path, command="ruff check src/")
         assert isinstance(result, LintResult)
+
+    def test_run_lint_reuses_result_for_unchanged_tree(self, lint_project, mock_lint_run):
+        """Test a second run on an unchanged tree skips the subprocess."""
+        first = run_lint(lint_project, command="ruff check src/")
+        first.issues.clear()
+        second = run_lint(lint_project, command="ruff check src/")
+
+        assert mock_lint_run.call_count == 1
+        assert len(second.issues) == 1
+
+    @pytest.mark.parametrize(
+        "change", ["edit_source", "add_stub", "add_config", "other_command"]
+    )
+    def test_run_lint_reruns_after_change(self, lint_project, mock_lint_run, change):
+        """Test source and stub edits, lint config and a new command all miss the cache."""
+        run_lint(lint_project, command="ruff check src/")
+        command = "ruff check src/"
+        if change == "edit_source":
+            (lint_project / "src" / "main.py").write_text("x = 10\n")
+        elif change == "add_stub":
+            (lint_project / "src" / "main.pyi").write_text("x: int\n")
+        elif change == "add_config":
+            (lint_project / "ruff.toml").write_text("line-length = 100\n")
+        else:
+            command = "ruff check ."
+
+        run_lint(lint_project, command=command)
+
+        assert mock_lint_run.call_count == 2
+
+    def test_run_lint_ignores_files_outside_targets(self, lint_project, mock_lint_run):
+        """Test files the command does not check leave the cached result valid."""
+        run_lint(lint_project, command="ruff check src/")
+        (lint_project / "scripts").mkdir()
+        (lint_project / "scripts" / "tool.py").write_text("y = 1\n")
+        run_lint(lint_project, command="ruff check src/")
+
+        assert mock_lint_run.call_count == 1
+
+    def test_run_lint_does_not_cache_other_tools(self, lint_project, mock_lint_run):
+        """Test non-Python linters always run, so edits to their files are seen."""
+        (lint_project / "src" / "app.js").write_text("let x = 1;\n")
+        run_lint(lint_project, command="npx eslint src/")
+        (lint_project / "src" / "app.js").write_text("let x = 2;\n")
+        run_lint(lint_project, command="npx eslint src/")
+
+        assert mock_lint_run.call_count == 2
+
+    def test_run_lint_never_caches_fix_or_failures(self, lint_project, mock_lint_run):
+        """Test --fix runs and timed-out runs always reach the subprocess."""
+        run_ruff_fix(lint_project)
+        run_ruff_fix(lint_project)
+        mock_lint_run.side_effect = subprocess.TimeoutExpired(cmd="ruff", timeout=1)
+        run_lint(lint_project, command="ruff check src/")
+        run_lint(lint_project, command="ruff check src/")
+
+        lint_calls = [
+            call for call in mock_lint_run.call_args_list
+            if call.args[0][:2] != ["poetry", "env"]
+        ]
+        assert len(lint_calls) == 4
+
+    def test_poetry_run_uses_virtualenv_executable(
+        self, lint_project, tmp_path_factory, monkeypatch
+    ):
+        """Test "poetry run" is resolved once to the virtualenv's binary."""
+        venv = tmp_path_factory.mktemp("venv")
+        (venv / "bin").mkdir()
+        ruff = venv / "bin" / "ruff"
+        ruff.write_text("#!/bin/sh\n")
+        ruff.chmod(0o755)
+
+        def fake_run(cmd, **kwargs):
+            stdout = f"{venv}\n" if cmd[:2] == ["poetry", "env"] else ""
+            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=stdout, stderr="")
+
+        run = Mock(side_effect=fake_run)
+        monkeypatch.setattr("agent_harness.lint.subprocess.run", run)
+
+        run_lint(lint_project, command="poetry run ruff check src/")
+        run_lint(lint_project, command="poetry run ruff check .")
+
+        commands = [call.args[0] for call in run.call_args_list]
+        assert commands == [
+            ["poetry", "env", "info", "--path"],
+            [str(ruff), "check", "src/"],
+            [str(ruff), "check", "."],
+        ]
+
+    @pytest.mark.parametrize("change", ["env_use", "edit_lock", "remove_venv"])
+    def test_poetry_run_reresolves_changed_environment(
+        self, lint_project, tmp_path_factory, monkeypatch, change
+    ):
+        """Test the virtualenv is looked up again when Poetry's environment changes."""
+        poetry_cache = tmp_path_factory.mktemp("poetry-cache")
+        monkeypatch.setenv("POETRY_CACHE_DIR", str(poetry_cache))
+        venvs = []
+        for name in ("venv-old", "venv-new"):
+            venv = tmp_path_factory.mktemp(name)
+            (venv / "bin").mkdir()
+            (venv / "bin" / "ruff").write_text("#!/bin/sh\n")
+            (venv / "bin" / "ruff").chmod(0o755)
+            venvs.append(venv)
+        current = [venvs[0]]
+
+        def fake_run(cmd, **kwargs):
+            stdout = f"{current[0]}\n" if cmd[:2] == ["poetry", "env"] else ""
+            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=stdout, stderr="")
+
+        run = Mock(side_effect=fake_run)
+        monkeypatch.setattr("agent_harness.lint.subprocess.run", run)
+
+        run_lint(lint_project, command="poetry run ruff check src/")
+        current[0] = venvs[1]
+        if change == "env_use":
+            (poetry_cache / "virtualenvs").mkdir()
+            (poetry_cache / "virtualenvs" / "envs.toml").write_text('[project]\nminor = "3.12"\n')
+        elif change == "edit_lock":
+            (lint_project / "poetry.lock").write_text("# updated\n")
+        else:
+            shutil.rmtree(venvs[0] / "bin")
+        run_lint(lint_project, command="poetry run ruff check .")
+
+        assert run.call_args.args[0] == [str(venvs[1] / "bin" / "ruff"), "check", "."]
+
+    def test_poetry_run_kept_without_poetry(self, lint_project, monkeypatch):
+        """Test the command runs unchanged when Poetry cannot be found."""
+        def fake_run(cmd, **kwargs):
+            if cmd[:2] == ["poetry", "env"]:
+                raise FileNotFoundError
+            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
+
+        run = Mock(side_effect=fake_run)
+        monkeypatch.setattr("agent_harness.lint.subprocess.run", run)
+
+        run_lint(lint_project, command="poetry run ruff check src/")
+
+        assert run.call_args.args[0] == ["poetry", "run", "ruff", "check", "src/"]
@@ -1,6 +1,8 @@
 """Tests for logging module."""
 
+import gc
 import json
+import os
 import pytest
 from pathlib import Path
 from datetime import datetime, timezone
@@ -17,6 +19,8 @@ from agent_harness.logging import (
     get_last_session_id,
     format_log_event,
     cleanup_old_logs,
+    _iter_lines_reversed,
+    _session_ranges,
 )
 
 
@@ -31,7 +35,8 @@ def temp_logs_dir(tmp_path):
 @pytest.fixture
 def logger(temp_logs_dir):
     """Create an EventLogger instance."""
-    return EventLogger(temp_logs_dir, session_id=1)
+    with EventLogger(temp_logs_dir, session_id=1) as event_logger:
+        yield event_logger
 
 
 class TestLogLevel:
@@ -106,6 +111,13 @@ class TestLogEvent:
         assert event.session_id == 10
         assert event.data == {"error": "Something broke"}
 
+    def test_log_event_from_dict_defaults(self):
+        """Test missing fields fall back to defaults on a slotted instance."""
+        event = LogEvent.from_dict({"event_type": "test"})
+
+        assert event == LogEvent("", "test", "routine", None, {})
+        assert not hasattr(event, "__dict__")
+
 
 class TestEventLogger:
     """Tests for EventLogger class."""
@@ -196,6 +208,55 @@ class TestEventLogger:
         assert event["data"]["duration_seconds"] == 300.5
 
 
+    def test_events_visible_without_flush(self, logger, temp_logs_dir):
+        """Test unbuffered loggers make each event readable immediately."""
+        logger.log_event("first", {})
+        logger.log_event("second", {})
+
+        events = read_log_file(temp_logs_dir / "events.jsonl")
+        assert [e.event_type for e in events] == ["first", "second"]
+
+    def test_buffered_logger_writes_on_flush_and_close(self, temp_logs_dir):
+        """Test buffered events reach disk on flush() and on leaving the context."""
+        events_file = temp_logs_dir / "events.jsonl"
+
+        with EventLogger(temp_logs_dir, session_id=1, buffered=True) as logger:
+            logger.log_event("first", {})
+            assert read_log_file(events_file) == []
+
+            logger.flush()
+            assert len(read_log_file(events_file)) == 1
+
+            logger.log_error("boom")
+
+        assert [e.event_type for e in read_log_file(events_file)] == ["first", "error"]
+        assert len(read_log_file(temp_logs_dir / "errors.jsonl")) == 1
+
+    def test_dropped_loggers_release_descriptors(self, temp_logs_dir):
+        """Test loggers garbage collected without close() do not leak descriptors."""
+        # Collect earlier tests' garbage first so only these loggers are counted
+        gc.collect()
+        open_before = len(os.listdir("/proc/self/fd"))
+
+        for session_id in range(20):
+            logger = EventLogger(temp_logs_dir, session_id=session_id)
+            logger.log_decision("Use strategy A")
+            del logger
+        gc.collect()
+
+        assert len(os.listdir("/proc/self/fd")) == open_before
+        assert len(read_log_file(temp_logs_dir / "events.jsonl")) == 20
+
+    def test_logger_reopens_files_after_close(self, logger, temp_logs_dir):
+        """Test logging after close() opens the files again."""
+        logger.log_event("before", {})
+        logger.close()
+        logger.log_event("after", {})
+
+        events = read_log_file(temp_logs_dir / "events.jsonl")
+        assert [e.event_type for e in events] == ["before", "after"]
+
+
 class TestReadLogFile:
     """Tests for read_log_file function."""
 
@@ -246,6 +307,38 @@ class TestReadLogFile:
         assert len(events) == 3
         assert events[0].event_type == "e3"
 
+    def test_read_log_file_offset_counts_lines_and_limit_counts_events(self, temp_logs_dir):
+        """Test offset skips raw lines while limit ignores blank and invalid ones."""
+        log_file = temp_logs_dir / "test.jsonl"
+        lines = [json.dumps({"event_type": f"e{i}"}) for i in range(6)]
+        lines[3:3] = ["", "not json"]
+        log_file.write_text("\n".join(lines) + "\n")
+
+        events = read_log_file(log_file, offset=2, limit=3)
+
+        assert [e.event_type for e in events] == ["e2", "e3", "e4"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_round_trip_non_ascii_and_int_keys(self, temp_logs_dir, monkeypatch, use_orjson):
+        """Test written events read back the same with either JSON backend."""
+        import agent_harness.logging as harness_logging
+
+        if not use_orjson:
+            monkeypatch.setattr(harness_logging, "orjson", None)
+            monkeypatch.setattr(harness_logging, "_loads", json.loads)
+        elif harness_logging.orjson is None:
+            pytest.skip("orjson not installed")
+
+        with EventLogger(temp_logs_dir, session_id=2) as logger:
+            logger.log_decision("Café ☕", context={1: "one", "big": 2**70})
+
+        for log_type in ("decisions", "events"):
+            (event,) = read_log_file(temp_logs_dir / f"{log_type}.jsonl")
+            assert event.data == {
+                "decision": "Café ☕",
+                "context": {"1": "one", "big": 2**70},
+            }
+
 
 class TestQueryLogs:
     """Tests for query_logs function."""
@@ -278,6 +371,15 @@ class TestQueryLogs:
 
         assert all(e.level in ["important", "critical"] for e in events)
 
+    def test_query_unknown_level_ranks_as_routine(self, temp_logs_dir):
+        """Test events with an unrecognized level are treated as routine."""
+        (temp_logs_dir / "events.jsonl").write_text(
+            json.dumps({"event_type": "odd", "level": "verbose"}) + "\n"
+        )
+
+        assert len(query_logs(temp_logs_dir, min_level=LogLevel.ROUTINE)) == 1
+        assert query_logs(temp_logs_dir, min_level=LogLevel.IMPORTANT) == []
+
     def test_query_by_text(self, logger, temp_logs_dir):
         """Test filtering by text query."""
         logger.log_event("file_read", {"path": "/test/foo.py"})
@@ -289,6 +391,116 @@ class TestQueryLogs:
         assert len(events) == 2
         assert all("file" in e.event_type for e in events)
 
+    def test_query_by_session_uses_index(self, logger, temp_logs_dir):
+        """Test a session query reads only that session's indexed ranges."""
+        for session_id, event_type in [(1, "a"), (1, "b"), (2, "c"), (1, "d")]:
+            logger.set_session(session_id)
+            logger.log_event(event_type, {})
+
+        ranges = _session_ranges(temp_logs_dir / "events.jsonl", 2)
+        events = query_logs(temp_logs_dir, session_id=1, reverse=False)
+
+        assert len(ranges) == 1 and ranges[0][0] > 0 and ranges[0][1] is not None
+        assert [e.event_type for e in events] == ["a", "b", "d"]
+
+    def test_query_by_session_with_interleaved_loggers(self, temp_logs_dir):
+        """Test two open loggers writing in turn are both indexed correctly."""
+        with EventLogger(temp_logs_dir, session_id=1) as first, \
+                EventLogger(temp_logs_dir, session_id=2) as second:
+            first.log_event("a", {})
+            second.log_event("b", {})
+            first.log_event("c", {})
+
+        events = query_logs(temp_logs_dir, session_id=1, reverse=False)
+
+        assert [e.event_type for e in events] == ["a", "c"]
+
+    def test_query_by_session_includes_unindexed_prefix(self, temp_logs_dir):
+        """Test events written before the index existed are still found."""
+        log_file = temp_logs_dir / "events.jsonl"
+        log_file.write_text(json.dumps({"event_type": "old", "session_id": 1}) + "\n")
+        with EventLogger(temp_logs_dir, session_id=2) as logger:
+            logger.log_event("new", {})
+
+        events = query_logs(temp_logs_dir, session_id=1)
+
+        assert [e.event_type for e in events] == ["old"]
+
+    def test_query_by_session_ignores_stale_index(self, logger, temp_logs_dir):
+        """Test an index that no longer fits the file falls back to a scan."""
+        logger.set_session(1)
+        logger.log_event("a", {})
+        logger.set_session(2)
+        logger.log_event("b", {})
+        log_file = temp_logs_dir / "events.jsonl"
+        log_file.write_text(json.dumps({"event_type": "x", "session_id": 2}) + "\n")
+
+        assert _session_ranges(log_file, 2) is None
+        assert [e.event_type for e in query_logs(temp_logs_dir, session_id=2)] == ["x"]
+
+    def test_query_by_session_with_buffered_and_unbuffered_loggers(self, temp_logs_dir):
+        """Test a buffered logger's events are found next to indexed ones."""
+        with EventLogger(temp_logs_dir, session_id=1, buffered=True) as buffered, \
+                EventLogger(temp_logs_dir, session_id=2) as unbuffered:
+            buffered.log_event("a", {})
+            unbuffered.log_event("b", {})
+            buffered.flush()
+            unbuffered.log_event("c", {})
+            buffered.log_event("d", {})
+
+        for session_id, expected in [(1, ["a", "d"]), (2, ["b", "c"])]:
+            events = query_logs(temp_logs_dir, session_id=session_id, reverse=False)
+            assert [e.event_type for e in events] == expected
+
+    def test_cached_index_rechecked_after_log_grows(self, logger, temp_logs_dir):
+        """Test a cached index is not trusted once the log grows without it."""
+        log_file = temp_logs_dir / "events.jsonl"
+        logger.log_event("a", {})
+        assert [e.event_type for e in query_logs(temp_logs_dir, session_id=1)] == ["a"]
+
+        with open(log_file, "a") as f:
+            f.write(json.dumps({"event_type": "external", "session_id": 1}) + "\n")
+
+        assert _session_ranges(log_file, 1) is None
+        events = query_logs(temp_logs_dir, session_id=1, reverse=False)
+        assert [e.event_type for e in events] == ["a", "external"]
+
+    def test_cached_index_rechecks_rewritten_header(self, logger, temp_logs_dir):
+        """Test a header rewritten in place is picked up when the stat is unchanged."""
+        log_file = temp_logs_dir / "events.jsonl"
+        index_file = temp_logs_dir / "events.idx"
+        logger.log_event("a", {})
+        assert query_logs(temp_logs_dir, session_id=1)
+        st = index_file.stat()
+
+        # Same session, so only the header changes; pin mtime as a coarse clock would
+        logger.log_event("b", {})
+        os.utime(index_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert index_file.stat().st_size == st.st_size
+
+        assert _session_ranges(log_file, 1) is not None
+        events = query_logs(temp_logs_dir, session_id=1, reverse=False)
+        assert [e.event_type for e in events] == ["a", "b"]
+
+    def test_unindexed_append_is_read_for_every_session(self, logger, temp_logs_dir):
+        """Test lines appended outside the logger are never hidden from session queries."""
+        log_file = temp_logs_dir / "events.jsonl"
+        logger.set_session(2)
+        logger.log_event("a", {})
+        with open(log_file, "a") as f:
+            f.write(json.dumps({"event_type": "external", "session_id": 1}) + "\n")
+
+        # Not yet covered by the index: full scan
+        assert _session_ranges(log_file, 1) is None
+        assert [e.event_type for e in query_logs(temp_logs_dir, session_id=1)] == ["external"]
+
+        # The next indexed write marks the foreign bytes as unknown
+        logger.log_event("b", {})
+        assert _session_ranges(log_file, 1) is not None
+        assert [e.event_type for e in query_logs(temp_logs_dir, session_id=1)] == ["external"]
+        events = query_logs(temp_logs_dir, session_id=2, reverse=False)
+        assert [e.event_type for e in events] == ["a", "b"]
+
 
 class TestFormatLogEvent:
     """Tests for format_log_event function."""
@@ -341,6 +553,27 @@ class TestFormatLogEvent:
         assert "/test/file.py" in formatted
 
 
+class TestGetSessionEvents:
+    """Tests for get_session_events function."""
+
+    def test_session_events_follow_new_writes(self, logger, temp_logs_dir):
+        """Test the cached session index picks up sessions logged later."""
+        logger.set_session(1)
+        logger.log_event("a", {})
+        logger.set_session(2)
+        logger.log_event("b", {})
+        assert [e.event_type for e in get_session_events(temp_logs_dir, 2)] == ["b"]
+
+        logger.set_session(1)
+        logger.log_event("c", {})
+        logger.set_session(2)
+        logger.log_event("d", {})
+
+        assert [e.event_type for e in get_session_events(temp_logs_dir, 1)] == ["c", "a"]
+        assert [e.event_type for e in get_session_events(temp_logs_dir, 2)] == ["d", "b"]
+        assert get_session_events(temp_logs_dir, 3) == []
+
+
 class TestGetLastSessionId:
     """Tests for get_last_session_id function."""
 
@@ -360,6 +593,29 @@ class TestGetLastSessionId:
         session_id = get_last_session_id(temp_logs_dir)
         assert session_id == 5
 
+    def test_skips_unusable_trailing_lines(self, temp_logs_dir):
+        """Test debug, session-less, blank and malformed lines are passed over."""
+        lines = [
+            {"event_type": "e1", "level": "routine", "session_id": 3},
+            {"event_type": "e2", "level": "debug", "session_id": 9},
+            {"event_type": "e3", "level": "routine", "session_id": None},
+        ]
+        (temp_logs_dir / "events.jsonl").write_text(
+            "\n".join(json.dumps(line) for line in lines) + "\nnot json\n\n"
+        )
+
+        assert get_last_session_id(temp_logs_dir) == 3
+
+    @pytest.mark.parametrize("block_size", [1, 7, 64, 4096])
+    def test_iter_lines_reversed(self, temp_logs_dir, block_size):
+        """Test lines come back newest first across any block boundary."""
+        log_file = temp_logs_dir / "test.jsonl"
+        log_file.write_bytes(b"first\n\n second \nthird line\nlast")
+
+        lines = list(_iter_lines_reversed(log_file, block_size=block_size))
+
+        assert lines == [b"last", b"third line", b"second", b"first"]
+
 
 class TestCleanupOldLogs:
     """Tests for cleanup_old_logs function."""
@@ -388,3 +644,40 @@ class TestCleanupOldLogs:
         # File should be truncated
         remaining_events = read_log_file(log_file)
         assert len(remaining_events) <= 1000 or lines_removed >= 0
+
+    def test_cleanup_keeps_last_1000_lines(self, temp_logs_dir):
+        """Test cleanup keeps exactly the newest 1000 lines intact."""
+        log_file = temp_logs_dir / "events.jsonl"
+        log_file.write_text(
+            "".join(json.dumps({"event_type": f"e{i}"}) + "\n" for i in range(2500))
+        )
+
+        lines_removed = cleanup_old_logs(temp_logs_dir, max_size_mb=0.001)
+
+        remaining = read_log_file(log_file)
+        assert lines_removed == 1500
+        assert len(remaining) == 1000
+        assert remaining[0].event_type == "e1500"
+        assert remaining[-1].event_type == "e2499"
+
+    def test_cleanup_leaves_short_files_alone(self, temp_logs_dir):
+        """Test a file over the size limit but within 1000 lines is untouched."""
+        log_file = temp_logs_dir / "events.jsonl"
+        content = "".join(json.dumps({"event_type": f"e{i}"}) + "\n" for i in range(1000))
+        log_file.write_text(content)
+
+        assert cleanup_old_logs(temp_logs_dir, max_size_mb=0.001) == 0
+        assert log_file.read_text() == content
+
+    def test_open_logger_keeps_appending_after_cleanup(self, temp_logs_dir):
+        """Test an open logger's writes land in the truncated file."""
+        with EventLogger(temp_logs_dir, session_id=1) as logger:
+            for i in range(1200):
+                logger.log_event(f"e{i}", {})
+            cleanup_old_logs(temp_logs_dir, max_size_mb=0.001)
+            logger.log_event("after", {})
+
+        events = read_log_file(temp_logs_dir / "events.jsonl")
+        assert len(events) == 1001
+        assert events[-1].event_type == "after"
+        assert len(query_logs(temp_logs_dir, session_id=1, limit=2000)) == 1001